@@ -0,0 +1,352 @@
+"""Batch forecasting for every store-item pair in the lookup table.
+
+Usage:
+    python -m app.batch --days 30 --workers 4 --output forecasts.csv
+    python -m app.batch --format parquet --output forecasts.parquet
+    python -m app.batch --routing-report routing.csv
+    python -m app.batch --profile      # writes forecasts.csv.profile.json
+
+With more than one worker, the parent lays out the per-series history and
+feature matrix once in shared memory; worker processes attach zero-copy
+views instead of unpickling the sample data themselves.
+
+Intermittent (slow, erratic) series are routed to a vectorized TSB estimator
+instead of the XGBoost rollout unless ``--no-intermittent`` is given.
+"""
+
+import argparse
+import multiprocessing as mp
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import (
+    MODEL_PATH,
+    FEATURES_PATH,
+    FEATURE_COLUMNS,
+    SAMPLE_DATA_PATH,
+    LOOKUP_PATH,
+    VALIDATION_CACHE_PATH,
+    MAX_FORECAST_DAYS,
+    HISTORY_DAYS,
+    INTERMITTENT_MAX_AVG_SALES,
+    INTERMITTENT_MIN_CV,
+    INTERMITTENT_MIN_DAYS,
+    TSB_HISTORY_DAYS,
+)
+from model.model_utils import load_model, forecast_from_arrays
+from model.intermittent_utils import (
+    classify_series,
+    intermittent_mask,
+    sales_window,
+    tsb_forecast,
+    routing_report,
+)
+from data.data_utils import load_sample_data, load_lookup_table, build_series_matrix
+from data.shared_utils import publish_arrays, attach_arrays, release_arrays
+from data.export_utils import EXPORT_COLUMNS, EXPORT_FORMATS, write_forecast_export
+from data.validation_utils import validate_inputs
+from app.profiling import PipelineProfiler, report_path_for
+
+# Per-process state, set once by _init_worker
+_worker = {}
+
+
+def _init_worker(spec, model_path, feature_columns):
+    """Attach to the shared series matrix and load the model once per worker."""
+    blocks, views = attach_arrays(spec)
+    _worker["blocks"] = blocks
+    _worker["arrays"] = views
+    _worker["model"] = load_model(model_path)
+    _worker["feature_columns"] = feature_columns
+
+
+def _forecast_series(arrays, model, feature_columns, idx, n_days):
+    """Forecast series ``idx`` of a series matrix."""
+    start, end = arrays["offsets"][idx], arrays["offsets"][idx + 1]
+    return forecast_from_arrays(
+        model,
+        arrays["features"][end - 1],
+        arrays["sales"][max(start, end - 30) : end],
+        arrays["last_dates"][idx],
+        feature_columns,
+        n_days,
+    )
+
+
+def _worker_task(args):
+    """Pool task: forecast one series using the shared matrix."""
+    idx, n_days = args
+    predictions = _forecast_series(
+        _worker["arrays"], _worker["model"], _worker["feature_columns"], idx, n_days
+    )
+    return idx, predictions
+
+
+def forecast_all(
+    arrays,
+    n_days,
+    model=None,
+    model_path=MODEL_PATH,
+    feature_columns=None,
+    workers=1,
+    intermittent=None,
+):
+    """Forecast every series of a series matrix.
+
+    Args:
+        arrays: Series matrix from ``build_series_matrix``
+        n_days: Number of days to forecast
+        model: Loaded model (used when workers == 1)
+        model_path: Model file each worker loads (used when workers > 1)
+        feature_columns: Feature names (default: FEATURE_COLUMNS)
+        workers: Number of processes
+        intermittent: Boolean mask of series forecast with TSB instead of
+            the model (default: none)
+
+    Returns:
+        Iterator of (series index, list of predictions), in series order
+    """
+    feature_columns = feature_columns or FEATURE_COLUMNS
+    n_series = len(arrays["keys"])
+    if intermittent is None:
+        intermittent = np.zeros(n_series, dtype=bool)
+
+    # Fast path: all intermittent series in one vectorized TSB pass
+    tsb_idx = np.flatnonzero(intermittent)
+    tsb_levels = dict(
+        zip(
+            tsb_idx.tolist(),
+            tsb_forecast(sales_window(arrays, tsb_idx, TSB_HISTORY_DAYS)).tolist(),
+        )
+    )
+    model_idx = np.flatnonzero(~intermittent).tolist()
+
+    if workers <= 1 or not model_idx:
+        if model_idx:
+            model = model if model is not None else load_model(model_path)
+        model_results = (
+            (idx, _forecast_series(arrays, model, feature_columns, idx, n_days))
+            for idx in model_idx
+        )
+        yield from _merge_results(n_series, tsb_levels, model_results, n_days)
+        return
+
+    blocks, spec = publish_arrays(arrays)
+    try:
+        with mp.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(spec, model_path, feature_columns),
+        ) as pool:
+            tasks = ((idx, n_days) for idx in model_idx)
+            model_results = pool.imap(_worker_task, tasks, chunksize=16)
+            yield from _merge_results(n_series, tsb_levels, model_results, n_days)
+    finally:
+        release_arrays(blocks, unlink=True)
+
+
+def _merge_results(n_series, tsb_levels, model_results, n_days):
+    """Interleave TSB and model results back into series order."""
+    model_results = iter(model_results)
+    for idx in range(n_series):
+        if idx in tsb_levels:
+            yield idx, [tsb_levels[idx]] * n_days
+        else:
+            yield next(model_results)
+
+
+def iter_forecast_frames(arrays, results, n_days, lookup_df=None, chunk_series=500):
+    """Convert forecast results to long DataFrames, a chunk of series at a time.
+
+    Args:
+        arrays: Series matrix the results were computed from
+        results: Iterable of (series index, list of predictions)
+        n_days: Number of forecast days
+        lookup_df: Lookup DataFrame used to add the family column
+        chunk_series: Number of series per yielded DataFrame
+
+    Returns:
+        Iterator of DataFrames with date, store_nbr, item_nbr, family,
+        predicted_sales
+    """
+    families = {}
+    if lookup_df is not None:
+        families = {
+            (row.store_nbr, row.item_nbr): row.family
+            for row in lookup_df.itertuples(index=False)
+        }
+
+    frames = []
+    for idx, predictions in results:
+        store_nbr, item_nbr = (int(v) for v in arrays["keys"][idx])
+        start = pd.Timestamp(arrays["last_dates"][idx]) + pd.Timedelta(days=1)
+        frames.append(
+            pd.DataFrame(
+                {
+                    "date": pd.date_range(start, periods=n_days, freq="D"),
+                    "store_nbr": store_nbr,
+                    "item_nbr": item_nbr,
+                    "family": families.get((store_nbr, item_nbr)),
+                    "predicted_sales": predictions,
+                }
+            )
+        )
+        if len(frames) >= chunk_series:
+            yield pd.concat(frames, ignore_index=True)
+            frames = []
+    if frames:
+        yield pd.concat(frames, ignore_index=True)
+
+
+def forecasts_to_frame(arrays, results, n_days, lookup_df=None):
+    """Convert forecast results to a single long DataFrame.
+
+    Args:
+        arrays: Series matrix the results were computed from
+        results: Iterable of (series index, list of predictions)
+        n_days: Number of forecast days
+        lookup_df: Lookup DataFrame used to add the family column
+
+    Returns:
+        DataFrame with date, store_nbr, item_nbr, family, predicted_sales
+    """
+    frames = list(iter_forecast_frames(arrays, results, n_days, lookup_df))
+    if not frames:
+        return pd.DataFrame(columns=EXPORT_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def check_inputs():
+    """Validate the input files, printing warnings and exiting on errors.
+
+    The verdict is cached by file hash, so unchanged inputs are not rescanned.
+
+    Returns:
+        Validation report
+    """
+    report = validate_inputs(
+        SAMPLE_DATA_PATH, LOOKUP_PATH, FEATURES_PATH, cache_path=VALIDATION_CACHE_PATH
+    )
+    for warning in report["warnings"]:
+        print(f"Warning: {warning}", file=sys.stderr)
+    if report["errors"]:
+        sys.exit(
+            "Input data failed validation:\n"
+            + "\n".join(f"- {error}" for error in report["errors"])
+        )
+    return report
+
+
+def build_catalog_matrix(df, lookup_df, end_date=None):
+    """Build the series matrix for every store-item pair in the lookup table.
+
+    Args:
+        df: Sample data DataFrame
+        lookup_df: Lookup DataFrame
+        end_date: Forecast cutoff date (default: latest)
+
+    Returns:
+        Series matrix from ``build_series_matrix``
+    """
+    pairs = pd.MultiIndex.from_frame(lookup_df[["store_nbr", "item_nbr"]])
+    mask = pd.MultiIndex.from_frame(df[["store_nbr", "item_nbr"]]).isin(pairs)
+    return build_series_matrix(
+        df[mask], FEATURE_COLUMNS, end_date=end_date, days=HISTORY_DAYS
+    )
+
+
+def classify_catalog(arrays, lookup_df):
+    """Intermittent-series mask for a catalog matrix using config thresholds.
+
+    Args:
+        arrays: Series matrix from ``build_catalog_matrix``
+        lookup_df: Lookup DataFrame
+
+    Returns:
+        Tuple (classified lookup DataFrame, boolean mask over series)
+    """
+    classified = classify_series(
+        lookup_df,
+        max_avg_sales=INTERMITTENT_MAX_AVG_SALES,
+        min_cv=INTERMITTENT_MIN_CV,
+        min_days=INTERMITTENT_MIN_DAYS,
+    )
+    return classified, intermittent_mask(arrays, classified)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=MAX_FORECAST_DAYS)
+    parser.add_argument("--end-date", default=None, help="Forecast cutoff date")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--output", default="forecasts.csv")
+    parser.add_argument("--format", choices=list(EXPORT_FORMATS), default="csv")
+    parser.add_argument(
+        "--no-intermittent",
+        action="store_true",
+        help="Forecast every series with the model (no TSB fast path)",
+    )
+    parser.add_argument(
+        "--routing-report", default=None, help="CSV with per-series routing"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record memory per stage (also FORECAST_PROFILE=1)",
+    )
+    args = parser.parse_args(argv)
+
+    profiler = PipelineProfiler(enabled=args.profile or None)
+
+    with profiler.stage("validate"):
+        check_inputs()
+
+    with profiler.stage("load_data"):
+        df = load_sample_data(SAMPLE_DATA_PATH)
+        lookup = load_lookup_table(LOOKUP_PATH)
+
+    with profiler.stage("build_matrix"):
+        arrays = build_catalog_matrix(df, lookup, end_date=args.end_date)
+        del df
+
+    with profiler.stage("classify"):
+        classified, intermittent = classify_catalog(arrays, lookup)
+        if args.no_intermittent:
+            intermittent[:] = False
+    print(f"Routing {intermittent.sum():,}/{len(intermittent):,} series to TSB")
+
+    if args.routing_report:
+        with profiler.stage("routing_report"):
+            report = routing_report(
+                classified,
+                arrays,
+                intermittent,
+                tsb_history_days=TSB_HISTORY_DAYS,
+                model=load_model(MODEL_PATH),
+                feature_columns=FEATURE_COLUMNS,
+            )
+            report.to_csv(args.routing_report, index=False)
+
+    # Forecasting and export are one streamed stage
+    with profiler.stage("forecast_export"):
+        results = forecast_all(
+            arrays, args.days, workers=args.workers, intermittent=intermittent
+        )
+        chunks = iter_forecast_frames(arrays, results, args.days, lookup)
+        n_rows = write_forecast_export(chunks, args.output, fmt=args.format)
+    print(f"Wrote {n_rows:,} rows to {args.output}")
+
+    report_path = profiler.write_report(report_path_for(args.output))
+    if report_path:
+        print(f"Wrote profile report to {report_path}")
+
+
+if __name__ == "__main__":
+    main()
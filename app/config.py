@@ -1,6 +1,7 @@
 """Configuration for Demand Forecasting App."""
 
 from pathlib import Path
+import tempfile
 
 # Base paths
 BASE_DIR = Path(__file__).parent.parent
@@ -17,12 +18,39 @@ CONFIG_PATH = ARTIFACTS_DIR / "model_config_full.json"
 SAMPLE_DATA_PATH = DATA_DIR / "sample_forecast_data.pkl"
 LOOKUP_PATH = DATA_DIR / "store_item_lookup.csv"
 
+# Precomputed forecasts (built by `python -m app.precompute`)
+FORECAST_STORE_PATH = DATA_DIR / "forecast_store.sqlite"
+
+# Data-quality verdict of the input files, keyed by their hash
+VALIDATION_CACHE_PATH = DATA_DIR / "validation_cache.json"
+
+# Temporary full-catalog exports of the app, removed once older than this
+EXPORT_DIR = Path(tempfile.gettempdir()) / "demand_forecast_exports"
+EXPORT_MAX_AGE_SECONDS = 3600
+
+# Forecasts running at once across all app sessions
+FORECAST_POOL_WORKERS = 2
+
+# Memory profiles of app sessions, one <session id>.json per session holding
+# its most recent stages (written when FORECAST_PROFILE=1)
+PROFILE_REPORT_DIR = BASE_DIR / "profile_reports"
+PROFILE_MAX_STAGES = 200
+
 # Forecast settings
 FORECAST_START = "2014-01-01"
 FORECAST_END = "2014-03-31"
 MAX_FORECAST_DAYS = 30
 HISTORY_DAYS = 180
 
+# Fast preview mode: predict with only the first N of the model's trees
+FAST_INFERENCE_TREES = 100
+
+# Intermittent-demand fast path: slow, erratic series are forecast with TSB
+INTERMITTENT_MAX_AVG_SALES = 2.5
+INTERMITTENT_MIN_CV = 1.0
+INTERMITTENT_MIN_DAYS = 60
+TSB_HISTORY_DAYS = 120
+
 # Feature columns (33 features per DEC-014)
 FEATURE_COLUMNS = [
     # Temporal (8)
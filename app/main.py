@@ -2,11 +2,14 @@
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from concurrent.futures import CancelledError, TimeoutError
 from datetime import timedelta
 from pathlib import Path
+import io
 import sys
+import tempfile
+import uuid
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
@@ -15,19 +18,48 @@ from app.config import (
     MODEL_PATH,
     SCALER_PATH,
     CONFIG_PATH,
+    FEATURES_PATH,
     FEATURE_COLUMNS,
     SAMPLE_DATA_PATH,
     LOOKUP_PATH,
     MAX_FORECAST_DAYS,
     HISTORY_DAYS,
+    FAST_INFERENCE_TREES,
+    FORECAST_STORE_PATH,
+    PROFILE_REPORT_DIR,
+    PROFILE_MAX_STAGES,
+    FORECAST_POOL_WORKERS,
+    EXPORT_DIR,
+    EXPORT_MAX_AGE_SECONDS,
+    VALIDATION_CACHE_PATH,
+)
+from model.model_utils import (
+    load_model,
+    load_scaler,
+    load_config,
+    autoregressive_forecast,
+    evaluate_fast_inference,
+    forecast_promo_scenarios,
 )
-from model.model_utils import load_model, load_scaler, load_config
 from data.data_utils import (
     load_sample_data,
     load_lookup_table,
     get_stores,
     get_items_for_store,
     get_history,
+    parse_promo_scenarios,
+)
+from data.export_utils import EXPORT_FORMATS, write_forecast_export, sweep_exports
+from data.cache_utils import read_forecast
+from data.validation_utils import validate_inputs
+from app.precompute import current_fingerprint
+from app.profiling import PipelineProfiler
+from app.worker_pool import ForecastPool, SharedModel
+from app.batch import (
+    build_catalog_matrix,
+    classify_catalog,
+    forecast_all,
+    iter_forecast_frames,
 )
 
 st.set_page_config(
@@ -35,12 +67,12 @@ st.set_page_config(
 )
 
 
-# Load artifacts (cached)
+# Load artifacts (cached, shared by all sessions)
 @st.cache_resource
 def load_artifacts():
     """Load model, scaler, and config (cached)."""
     try:
-        model = load_model(MODEL_PATH)
+        model = SharedModel(load_model(MODEL_PATH))
         scaler = load_scaler(SCALER_PATH)
         config = load_config(CONFIG_PATH)
         return model, scaler, config
@@ -49,7 +81,8 @@ def load_artifacts():
         return None, None, None
 
 
-@st.cache_data
+# Shared read-only across sessions instead of copied per rerun
+@st.cache_resource
 def load_data():
     """Load sample data and lookup table (cached)."""
     try:
@@ -61,64 +94,123 @@ def load_data():
         return None, None
 
 
-def autoregressive_forecast(model, history, feature_columns, n_days):
+@st.cache_data
+def get_validation_report():
+    """Data-quality verdict of the input files (cached, also on disk)."""
+    return validate_inputs(
+        SAMPLE_DATA_PATH, LOOKUP_PATH, FEATURES_PATH, cache_path=VALIDATION_CACHE_PATH
+    )
+
+
+@st.cache_data
+def get_fast_inference_report(_model, _df, n_trees):
+    """Accuracy of the truncated model on the sample data (cached)."""
+    return evaluate_fast_inference(_model, _df, FEATURE_COLUMNS, n_trees)
+
+
+@st.cache_data
+def get_cache_fingerprint():
+    """Fingerprint of the loaded data and model files (cached)."""
+    return current_fingerprint()
+
+
+@st.cache_resource
+def get_forecast_pool():
+    """Forecast worker pool shared by all sessions (cached)."""
+    return ForecastPool(max_workers=FORECAST_POOL_WORKERS)
+
+
+def run_forecast(
+    model,
+    history,
+    store_nbr,
+    item_nbr,
+    forecast_date,
+    n_days,
+    fingerprint=None,
+    iteration_range=None,
+    promo_scenarios=None,
+):
+    """Forecast job executed in the shared pool (no Streamlit calls).
+
+    Returns:
+        Tuple (predictions, served_from_store, scenario DataFrame or None)
     """
-    Generate multi-day forecast with autoregressive updates.
+    # Precomputed store first (full model only), live rollout on a miss
+    cached = None
+    if fingerprint is not None:
+        cached = read_forecast(
+            FORECAST_STORE_PATH,
+            fingerprint,
+            store_nbr,
+            item_nbr,
+            forecast_date,
+            n_days,
+        )
+
+    if cached is not None:
+        predictions = cached["predicted_sales"].tolist()
+    else:
+        # Generate predictions using autoregressive method
+        predictions = autoregressive_forecast(
+            model, history, FEATURE_COLUMNS, n_days, iteration_range=iteration_range
+        )
+
+    # Promotion scenarios (only when requested), one batched rollout
+    scenario_df = None
+    if promo_scenarios:
+        scenario_df = forecast_promo_scenarios(
+            model,
+            history,
+            FEATURE_COLUMNS,
+            promo_scenarios,
+            iteration_range=iteration_range,
+        )
 
-    Each prediction updates lag features for the next prediction:
-    - lag1 becomes the new prediction
-    - lag7 shifts by 1 day
-    - Rolling averages update with new value
+    return predictions, cached is not None, scenario_df
+
+
+def run_catalog_export(model, df, lookup, forecast_date, n_days, export_format):
+    """Catalog export job executed in the shared pool (no Streamlit calls).
+
+    Exports are written to EXPORT_DIR, which is swept by age on every
+    export; that also removes files of runs interrupted while waiting and
+    of sessions that ended without downloading.
+
+    Returns:
+        Tuple (number of rows, path of the temporary export file)
     """
-    predictions = []
-
-    # Get initial feature values from latest history row
-    latest = history.tail(1).copy()
-    X = latest[feature_columns].values.flatten().astype(np.float32)
-
-    # Create feature index map for easy updates
-    feat_idx = {col: i for i, col in enumerate(feature_columns)}
-
-    # Track recent predictions for rolling calculations
-    recent_sales = history["unit_sales"].tail(30).tolist()
-
-    for day in range(n_days):
-        # Predict
-        pred = model.predict(X.reshape(1, -1))[0]
-        pred = max(0, float(pred))  # No negative sales
-        predictions.append(pred)
-
-        # Update features for next prediction (autoregressive)
-        if day < n_days - 1:
-            # Add prediction to recent sales
-            recent_sales.append(pred)
-            if len(recent_sales) > 30:
-                recent_sales.pop(0)
-
-            # Update lag features
-            if "unit_sales_lag1" in feat_idx:
-                X[feat_idx["unit_sales_lag1"]] = pred
-
-            # Update rolling averages
-            if "unit_sales_7d_avg" in feat_idx and len(recent_sales) >= 7:
-                X[feat_idx["unit_sales_7d_avg"]] = np.mean(recent_sales[-7:])
-            if "unit_sales_14d_avg" in feat_idx and len(recent_sales) >= 14:
-                X[feat_idx["unit_sales_14d_avg"]] = np.mean(recent_sales[-14:])
-            if "unit_sales_30d_avg" in feat_idx and len(recent_sales) >= 30:
-                X[feat_idx["unit_sales_30d_avg"]] = np.mean(recent_sales[-30:])
-
-            # Update calendar features
-            next_date = pd.Timestamp(history["date"].max()) + timedelta(days=day + 1)
-            if "dayofweek" in feat_idx:
-                X[feat_idx["dayofweek"]] = next_date.dayofweek
-            if "day" in feat_idx:
-                X[feat_idx["day"]] = next_date.day
-            if "month" in feat_idx:
-                X[feat_idx["month"]] = next_date.month
-            if "weekend" in feat_idx:
-                X[feat_idx["weekend"]] = 1 if next_date.dayofweek >= 5 else 0
-
-    return predictions
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    sweep_exports(EXPORT_DIR, EXPORT_MAX_AGE_SECONDS)
+
+    arrays = build_catalog_matrix(df, lookup, end_date=forecast_date)
+    _, intermittent = classify_catalog(arrays, lookup)
+    results = forecast_all(arrays, n_days, model=model, intermittent=intermittent)
+    extension = EXPORT_FORMATS[export_format]["extension"]
+    with tempfile.NamedTemporaryFile(
+        suffix=f".{extension}", dir=EXPORT_DIR, delete=False
+    ) as f:
+        n_rows = write_forecast_export(
+            iter_forecast_frames(arrays, results, n_days, lookup),
+            f,
+            fmt=export_format,
+        )
+    return n_rows, f.name
+
+
+def wait_for(future, poll_seconds=0.1):
+    """Wait for a pool job without blocking Streamlit's rerun handling.
+
+    Streamlit only acts on a rerun request (e.g. a re-click) at the next
+    ``st.*`` call, so poll the future and touch a placeholder in between;
+    the newer run then supersedes this one in the pool.
+    """
+    placeholder = st.empty()
+    while True:
+        try:
+            return future.result(timeout=poll_seconds)
+        except TimeoutError:
+            placeholder.empty()
 
 
 # Main app
@@ -137,19 +229,51 @@ with st.popover("ℹ️ How to Use"):
     **Features:**
     - 📈 View historical sales + forecast chart
     - 📋 See detailed prediction table
-    - 📥 Download forecast as CSV
+    - 📥 Download forecast as CSV or Parquet
+    - 🎯 Compare promotion scenarios (Multi-Day mode)
+    - 📦 Export a forecast for the full catalog
     
     **Note:** Forecasts use an XGBoost model trained on 3.8M transactions from Guayas stores.
     """)
 
+# Session identity for request coalescing in the shared pool
+session_id = st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+# Per-session memory profile (enabled with FORECAST_PROFILE=1), rewritten
+# after every stage so reruns that stop early are recorded too
+profiler = st.session_state.setdefault(
+    "profiler",
+    PipelineProfiler(
+        label=session_id,
+        report_path=PROFILE_REPORT_DIR / f"{session_id}.json",
+        max_stages=PROFILE_MAX_STAGES,
+    ),
+)
+profiler.start_run()
+pool = get_forecast_pool()
+# Any earlier request of this session belongs to a superseded run
+pool.cancel(session_id)
+
 # Load everything
-model, scaler, config = load_artifacts()
-df, lookup = load_data()
+with profiler.stage("load"):
+    model, scaler, config = load_artifacts()
+    df, lookup = load_data()
 
 if model is None or df is None:
     st.error("Failed to load required files. Please check configuration.")
     st.stop()
 
+# Data-quality checks (scanned once per input version)
+validation = get_validation_report()
+if validation["errors"]:
+    st.error(
+        "Input data failed validation:\n"
+        + "\n".join(f"- {error}" for error in validation["errors"])
+    )
+    st.stop()
+for warning in validation["warnings"]:
+    st.warning(warning)
+
 # Sidebar - Model Info
 st.sidebar.header("📊 Model Information")
 st.sidebar.write(f"**Model:** {config['model_type'].upper()}")
@@ -210,16 +334,51 @@ if forecast_mode == "Multi-Day":
 else:
     n_days = 1
 
+# Promotion what-if scenarios (one "name: days" per line), opt-in so plain
+# forecasts never pay for the extra rollout
+promo_scenarios = {}
+if forecast_mode == "Multi-Day":
+    with st.sidebar.expander("🎯 Promotion Scenarios"):
+        if st.checkbox("Compare promotion scenarios"):
+            scenario_text = st.text_area(
+                "Scenarios",
+                value="No promo: none\nPromo every day: all",
+                help="One scenario per line as 'name: days', e.g. '3-7, 10', 'all' or 'none'",
+            )
+            try:
+                promo_scenarios = parse_promo_scenarios(scenario_text, n_days)
+            except ValueError as e:
+                st.error(str(e))
+
+# Fast preview: fewer trees for interactive use; batch keeps the full model
+fast_mode = st.sidebar.toggle(
+    "⚡ Fast Preview",
+    help=f"Predict with the first {FAST_INFERENCE_TREES} trees only",
+)
+if fast_mode:
+    fast_report = get_fast_inference_report(model, df, FAST_INFERENCE_TREES)
+    st.sidebar.caption(
+        f"{fast_report['n_trees']}/{fast_report['total_trees']} trees · "
+        f"RMSE {fast_report['rmse_fast']:.2f} vs {fast_report['rmse_full']:.2f} full · "
+        f"mean |Δ| {fast_report['mae_vs_full']:.2f} units · "
+        f"{fast_report['speedup']:.1f}x faster"
+    )
+iteration_range = (0, FAST_INFERENCE_TREES) if fast_mode else None
+
+export_format = st.sidebar.selectbox("Export Format", list(EXPORT_FORMATS))
+
 # Generate Forecast button
 generate_forecast = st.sidebar.button("🔮 Generate Forecast", type="primary")
+export_catalog = st.sidebar.button("📦 Export Full Catalog")
 
 # Main content
 st.markdown("---")
 
 # Get history for display
-history = get_history(
-    df, selected_store, selected_item, end_date=forecast_date, days=HISTORY_DAYS
-)
+with profiler.stage("get_history"):
+    history = get_history(
+        df, selected_store, selected_item, end_date=forecast_date, days=HISTORY_DAYS
+    )
 
 if len(history) == 0:
     st.warning("No historical data available for this store-item combination.")
@@ -241,8 +400,27 @@ st.markdown("---")
 # Generate forecast when button clicked
 if generate_forecast:
     with st.spinner("Generating forecast..."):
-        # Generate predictions using autoregressive method
-        predictions = autoregressive_forecast(model, history, FEATURE_COLUMNS, n_days)
+        with profiler.stage("forecast"):
+            # A newer click from this session cancels this request
+            future = pool.submit(
+                session_id,
+                run_forecast,
+                model,
+                history,
+                selected_store,
+                selected_item,
+                forecast_date,
+                n_days,
+                fingerprint=None if fast_mode else get_cache_fingerprint(),
+                iteration_range=iteration_range,
+                promo_scenarios=promo_scenarios,
+            )
+            try:
+                predictions, from_store, scenario_df = wait_for(future)
+            except CancelledError:
+                st.stop()
+            if not pool.is_current(session_id, future):
+                st.stop()
 
         # Create dates for forecast
         dates = [
@@ -254,9 +432,12 @@ if generate_forecast:
 
         # Display results
         st.subheader("📈 Forecast Results")
+        if from_store:
+            st.caption("⚡ Served from precomputed forecasts")
 
         # Plot
-        fig, ax = plt.subplots(figsize=(12, 5))
+        fig = Figure(figsize=(12, 5))
+        ax = fig.subplots()
 
         # History
         ax.plot(
@@ -292,8 +473,9 @@ if generate_forecast:
         ax.legend()
         ax.grid(True, alpha=0.3)
 
-        plt.tight_layout()
-        st.pyplot(fig)
+        fig.tight_layout()
+        with profiler.stage("render_plot"):
+            st.pyplot(fig)
 
         # Forecast table
         st.subheader("📋 Forecast Details")
@@ -319,27 +501,69 @@ if generate_forecast:
             hist_avg = history["unit_sales"].mean()
             st.metric("Historical Average", f"{hist_avg:.1f} units")
 
-        # CSV Download
-        csv = forecast_df.to_csv(index=False)
+        # Download
+        export_df = forecast_df.assign(
+            store_nbr=selected_store,
+            item_nbr=selected_item,
+            family=item_info["family"],
+        )
+        buffer = io.BytesIO()
+        write_forecast_export([export_df], buffer, fmt=export_format)
+        extension = EXPORT_FORMATS[export_format]["extension"]
         st.download_button(
-            label="📥 Download Forecast CSV",
-            data=csv,
-            file_name=f"forecast_store{selected_store}_item{selected_item}_{forecast_date}.csv",
-            mime="text/csv",
+            label="📥 Download Forecast",
+            data=buffer.getvalue(),
+            file_name=f"forecast_store{selected_store}_item{selected_item}_{forecast_date}.{extension}",
+            mime=EXPORT_FORMATS[export_format]["mime"],
         )
 
+        # Promotion scenarios
+        if scenario_df is not None:
+            st.subheader("🎯 Promotion Scenarios")
+            scenario_df.index = dates
+
+            fig = Figure(figsize=(12, 5))
+            ax = fig.subplots()
+            for name in scenario_df.columns:
+                ax.plot(scenario_df.index, scenario_df[name], marker="o", label=name)
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Unit Sales")
+            ax.set_title(
+                f"Promotion Scenarios - Store {selected_store}, Item {selected_item}"
+            )
+            ax.legend()
+            ax.grid(True, alpha=0.3)
+            fig.tight_layout()
+            st.pyplot(fig)
+
+            baseline = scenario_df.iloc[:, 0].sum()
+            summary_df = pd.DataFrame(
+                {
+                    "Scenario": scenario_df.columns,
+                    "Promo Days": [int(promo_scenarios[n].sum()) for n in scenario_df],
+                    "Total Forecast": scenario_df.sum().round(1).values,
+                    "Daily Average": scenario_df.mean().round(2).values,
+                    f"Δ vs {scenario_df.columns[0]}": (scenario_df.sum() - baseline)
+                    .round(1)
+                    .values,
+                }
+            )
+            st.dataframe(summary_df, use_container_width=True, hide_index=True)
+
 else:
     # Show historical data when no forecast generated
     st.subheader("Historical Sales")
 
-    fig, ax = plt.subplots(figsize=(12, 5))
+    fig = Figure(figsize=(12, 5))
+    ax = fig.subplots()
     ax.plot(history["date"], history["unit_sales"], color="#3498db")
     ax.set_xlabel("Date")
     ax.set_ylabel("Unit Sales")
     ax.set_title(f"Historical Sales - Store {selected_store}, Item {selected_item}")
     ax.grid(True, alpha=0.3)
-    plt.tight_layout()
-    st.pyplot(fig)
+    fig.tight_layout()
+    with profiler.stage("render_plot"):
+        st.pyplot(fig)
 
     # Stats
     col1, col2, col3, col4 = st.columns(4)
@@ -356,6 +580,47 @@ else:
         "👈 Configure settings in the sidebar and click **Generate Forecast** to create predictions."
     )
 
+# Full-catalog export, streamed to a temporary file chunk by chunk
+if export_catalog:
+    # Only the latest export of a session is kept on disk
+    previous_path = st.session_state.pop("catalog_export_path", None)
+    if previous_path:
+        Path(previous_path).unlink(missing_ok=True)
+
+    extension = EXPORT_FORMATS[export_format]["extension"]
+    with st.spinner("Forecasting full catalog..."):
+        future = pool.submit(
+            session_id,
+            run_catalog_export,
+            model,
+            df,
+            lookup,
+            forecast_date,
+            n_days,
+            export_format,
+        )
+        try:
+            n_rows, export_path = wait_for(future)
+        except CancelledError:
+            st.stop()
+        if not pool.is_current(session_id, future):
+            Path(export_path).unlink()
+            st.stop()
+    st.session_state["catalog_export_path"] = export_path
+
+    st.success(f"Catalog forecast ready: {n_rows:,} rows")
+    # Deferred: the file is only read when the button is clicked. Streamlit
+    # still holds it in memory for that download; use app.batch for
+    # catalogs too large for the server.
+    st.download_button(
+        label="📦 Download Catalog Forecast",
+        data=Path(export_path).read_bytes,
+        file_name=f"forecast_catalog_{forecast_date}_{n_days}d.{extension}",
+        mime=EXPORT_FORMATS[export_format]["mime"],
+        on_click="ignore",
+    )
+
+
 # Footer
 st.markdown("---")
 st.caption(
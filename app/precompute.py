@@ -0,0 +1,118 @@
+"""Precompute forecasts for every lookup pair at the latest cutoff.
+
+Usage:
+    python -m app.precompute            # rebuild only if data/model changed
+    python -m app.precompute --force    # always rebuild
+    python -m app.precompute --profile  # also write <store>.profile.json
+
+Forecasts cover MAX_FORECAST_DAYS; shorter horizons are prefixes of the same
+autoregressive rollout, so the UI reads any horizon straight from the store.
+Schedule it (e.g. cron) after data or model updates:
+
+    0 3 * * * cd /path/to/app && python -m app.precompute
+"""
+
+import argparse
+from pathlib import Path
+import sys
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import (
+    MODEL_PATH,
+    FEATURES_PATH,
+    SAMPLE_DATA_PATH,
+    LOOKUP_PATH,
+    MAX_FORECAST_DAYS,
+    FORECAST_STORE_PATH,
+)
+from app.batch import (
+    build_catalog_matrix,
+    check_inputs,
+    forecast_all,
+    iter_forecast_frames,
+)
+from model.model_utils import load_model
+from data.data_utils import load_sample_data, load_lookup_table
+from app.profiling import PipelineProfiler, report_path_for
+from data.cache_utils import (
+    file_fingerprint,
+    get_store_fingerprint,
+    write_forecast_store,
+)
+
+
+def current_fingerprint():
+    """Fingerprint of the data and model files the forecasts depend on."""
+    return file_fingerprint(MODEL_PATH, FEATURES_PATH, SAMPLE_DATA_PATH, LOOKUP_PATH)
+
+
+def precompute(store_path=FORECAST_STORE_PATH, force=False, workers=1, profiler=None):
+    """Rebuild the forecast store if the data or model changed.
+
+    Args:
+        store_path: SQLite file to write
+        force: Rebuild even if the store is current
+        workers: Number of forecasting processes
+        profiler: PipelineProfiler recording each stage (optional)
+
+    Returns:
+        Number of rows written (0 if the store was already current)
+    """
+    profiler = profiler or PipelineProfiler(enabled=False)
+
+    with profiler.stage("fingerprint"):
+        fingerprint = current_fingerprint()
+        if not force and get_store_fingerprint(store_path) == fingerprint:
+            return 0
+
+    with profiler.stage("validate"):
+        check_inputs()
+
+    with profiler.stage("load_data"):
+        df = load_sample_data(SAMPLE_DATA_PATH)
+        lookup = load_lookup_table(LOOKUP_PATH)
+
+    with profiler.stage("build_matrix"):
+        arrays = build_catalog_matrix(df, lookup)
+        del df
+
+    # Same model path as the interactive forecast (no TSB routing), so cached
+    # and live forecasts are identical
+    with profiler.stage("forecast_store"):
+        model = load_model(MODEL_PATH) if workers <= 1 else None
+        results = forecast_all(arrays, MAX_FORECAST_DAYS, model=model, workers=workers)
+        chunks = iter_forecast_frames(arrays, results, MAX_FORECAST_DAYS)
+        return write_forecast_store(store_path, fingerprint, chunks)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--store", default=str(FORECAST_STORE_PATH))
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record memory per stage (also FORECAST_PROFILE=1)",
+    )
+    args = parser.parse_args(argv)
+
+    profiler = PipelineProfiler(enabled=args.profile or None)
+    n_rows = precompute(
+        args.store, force=args.force, workers=args.workers, profiler=profiler
+    )
+    if n_rows:
+        print(f"Wrote {n_rows:,} forecast rows to {args.store}")
+    else:
+        print(f"{args.store} is up to date")
+
+    report_path = profiler.write_report(report_path_for(args.store))
+    if report_path:
+        print(f"Wrote profile report to {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""Memory and allocation profiling for the forecast pipeline.
+
+Enable with the FORECAST_PROFILE environment variable (any value other than
+"" or "0") or the ``--profile`` flag of the batch and precompute commands.
+Each pipeline stage records wall time, RSS before and after the stage, the
+peak RSS sampled while it ran and the top tracemalloc allocators; the report
+is written as JSON next to the command's output.
+
+tracemalloc is process-wide: it is started once and left running, and stages
+that overlap in other threads (concurrent app sessions) share its counters.
+"""
+
+from contextlib import contextmanager
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_ENV_VAR = "FORECAST_PROFILE"
+
+_tracing_lock = threading.Lock()
+
+
+def profiling_enabled():
+    """Whether profiling is switched on through the environment."""
+    return os.environ.get(PROFILE_ENV_VAR, "") not in ("", "0")
+
+
+def start_tracing():
+    """Start tracemalloc for the process (once; it is never stopped here)."""
+    with _tracing_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def rss_bytes():
+    """Current resident set size of this process (None if unknown)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def process_peak_rss_bytes():
+    """Lifetime peak resident set size of this process (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RssSampler:
+    """Track the highest RSS seen while running, sampled in a thread.
+
+    Catches spikes that are freed again before a stage ends, including
+    native allocations (e.g. XGBoost buffers) that tracemalloc does not see.
+
+    Args:
+        interval: Seconds between samples
+    """
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        rss = rss_bytes()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._sample()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+def report_path_for(output_path):
+    """Profile report path placed alongside an output file."""
+    return f"{output_path}.profile.json"
+
+
+class PipelineProfiler:
+    """Collect per-stage memory statistics.
+
+    When disabled, ``stage`` is a no-op so call sites need no branching.
+
+    Args:
+        enabled: Turn profiling on (default: from FORECAST_PROFILE)
+        top_n: Number of allocation sites kept per stage
+        label: Identifier added to the report (e.g. an app session)
+        report_path: When given, the report is rewritten after every stage,
+            so runs that end early still leave one
+        max_stages: Number of most recent stages kept (default: all)
+        sample_interval: Seconds between RSS samples during a stage
+    """
+
+    def __init__(
+        self,
+        enabled=None,
+        top_n=10,
+        label=None,
+        report_path=None,
+        max_stages=None,
+        sample_interval=0.01,
+    ):
+        self.enabled = profiling_enabled() if enabled is None else enabled
+        self.top_n = top_n
+        self.label = label
+        self.report_path = report_path
+        self.max_stages = max_stages
+        self.sample_interval = sample_interval
+        self.run = 0
+        self.stages = []
+
+    def start_run(self):
+        """Start a new run (e.g. an app rerun); later stages are tagged with it."""
+        self.run += 1
+
+    @contextmanager
+    def stage(self, name):
+        """Profile the enclosed block as one pipeline stage."""
+        if not self.enabled:
+            yield
+            return
+
+        start_tracing()
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        current_before = tracemalloc.get_traced_memory()[0]
+        rss_before = rss_bytes()
+        start = time.perf_counter()
+        try:
+            with RssSampler(self.sample_interval) as sampler:
+                yield
+        finally:
+            seconds = time.perf_counter() - start
+            rss_after = rss_bytes()
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+
+            diff = after.compare_to(before, "lineno")
+            top = [
+                {
+                    "location": str(stat.traceback[0]),
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                }
+                for stat in diff[: self.top_n]
+            ]
+            self.stages.append(
+                {
+                    "stage": name,
+                    "run": self.run,
+                    "seconds": seconds,
+                    "rss_before_bytes": rss_before,
+                    "rss_after_bytes": rss_after,
+                    "peak_rss_bytes": sampler.peak,
+                    "process_peak_rss_bytes": process_peak_rss_bytes(),
+                    "traced_peak_bytes": peak - current_before,
+                    "traced_retained_bytes": current - current_before,
+                    "top_allocators": top,
+                }
+            )
+            if self.max_stages is not None:
+                del self.stages[: -self.max_stages]
+            if self.report_path is not None:
+                self.write_report(self.report_path)
+
+    def report(self):
+        """Profile report as a dictionary."""
+        return {
+            "label": self.label,
+            "pid": os.getpid(),
+            "process_peak_rss_bytes": process_peak_rss_bytes(),
+            "stages": self.stages,
+        }
+
+    def write_report(self, path):
+        """Write the report as JSON (does nothing when disabled).
+
+        The file is replaced atomically, so readers and concurrent writers
+        never see a partial report.
+
+        Args:
+            path: Output JSON file
+
+        Returns:
+            The path written, or None when profiling is disabled
+        """
+        if not self.enabled:
+            return None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(self.report(), f, indent=2)
+        os.replace(f.name, path)
+        return path
@@ -0,0 +1,115 @@
+"""Shared forecasting worker pool for concurrent Streamlit sessions.
+
+All sessions submit forecast work to one bounded thread pool, so ten
+analysts do not mean ten concurrent rollouts competing for the CPU. A new
+request from a session supersedes its previous one: queued work is
+cancelled and a running job's result is discarded; a rerun can also drop
+its session's request without submitting a new one. Model access is
+serialized because every predict call already uses all cores.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import weakref
+
+
+class SharedModel:
+    """Thread-safe wrapper around a model shared by all sessions.
+
+    ``predict`` calls are serialized with a lock; every other attribute is
+    passed through to the wrapped model.
+
+    Args:
+        model: Trained model
+    """
+
+    def __init__(self, model):
+        self._model = model
+        self._lock = threading.Lock()
+
+    def predict(self, X, **kwargs):
+        """Predict while holding the model lock."""
+        with self._lock:
+            return self._model.predict(X, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._model, name)
+
+
+class ForecastPool:
+    """Bounded pool with per-session request coalescing.
+
+    Args:
+        max_workers: Maximum number of forecasts running at once
+    """
+
+    def __init__(self, max_workers=2):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="forecast"
+        )
+        self._lock = threading.Lock()
+        # Latest request per session; kept after completion so a superseded
+        # request can be recognized as stale, but only while someone still
+        # holds the future, so finished sessions do not accumulate results
+        self._latest = weakref.WeakValueDictionary()
+        self._pending = {}
+
+    def submit(self, session_key, fn, *args, **kwargs):
+        """Run ``fn`` in the pool, superseding the session's previous request.
+
+        Args:
+            session_key: Identifier of the requesting session
+            fn: Callable to run
+            *args, **kwargs: Passed to fn
+
+        Returns:
+            concurrent.futures.Future of the new request
+        """
+        future = self._executor.submit(fn, *args, **kwargs)
+        with self._lock:
+            previous = self._pending.get(session_key)
+            self._pending[session_key] = future
+            self._latest[session_key] = future
+        future.add_done_callback(lambda f: self._forget(session_key, f))
+
+        # Outside the lock: cancelling runs the done-callback synchronously.
+        # Only succeeds while queued; a running job finishes but its result
+        # is no longer current (see is_current)
+        if previous is not None:
+            previous.cancel()
+        return future
+
+    def cancel(self, session_key):
+        """Drop the session's request, e.g. at the start of a rerun.
+
+        A queued request is cancelled; a running one finishes but is no
+        longer current.
+
+        Args:
+            session_key: Identifier of the session
+        """
+        with self._lock:
+            previous = self._pending.get(session_key)
+            self._latest.pop(session_key, None)
+        if previous is not None:
+            previous.cancel()
+
+    def is_current(self, session_key, future):
+        """Whether ``future`` is still the session's latest request."""
+        with self._lock:
+            return self._latest.get(session_key) is future
+
+    def pending_count(self):
+        """Number of sessions with a queued or running request."""
+        with self._lock:
+            return len(self._pending)
+
+    def shutdown(self, wait=True):
+        """Stop the pool, cancelling queued work."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _forget(self, session_key, future):
+        """Drop a finished request unless a newer one replaced it."""
+        with self._lock:
+            if self._pending.get(session_key) is future:
+                del self._pending[session_key]
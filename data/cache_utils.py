@@ -0,0 +1,142 @@
+"""Precomputed forecast store (SQLite) and file fingerprints."""
+
+import hashlib
+import sqlite3
+from contextlib import closing
+
+import pandas as pd
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS forecasts (
+    fingerprint TEXT NOT NULL,
+    store_nbr INTEGER NOT NULL,
+    item_nbr INTEGER NOT NULL,
+    cutoff TEXT NOT NULL,
+    horizon INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    predicted_sales REAL NOT NULL,
+    PRIMARY KEY (fingerprint, store_nbr, item_nbr, cutoff, horizon)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+
+
+def file_fingerprint(*paths, block_size=1 << 20):
+    """SHA-256 over the contents of one or more files, read in blocks.
+
+    Args:
+        *paths: Files to hash, in order
+        block_size: Bytes read at a time
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            while block := f.read(block_size):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def _connect(store_path):
+    """Open the store and make sure the schema exists."""
+    conn = sqlite3.connect(store_path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def get_store_fingerprint(store_path):
+    """Fingerprint the store was last built for (None if never built)."""
+    with closing(_connect(store_path)) as conn:
+        row = conn.execute(
+            "SELECT value FROM meta WHERE key = 'fingerprint'"
+        ).fetchone()
+    return row[0] if row else None
+
+
+def write_forecast_store(store_path, fingerprint, chunks):
+    """Replace the store contents with freshly computed forecasts.
+
+    Rows of other fingerprints are removed, so the store only ever holds
+    forecasts of the current data and model.
+
+    Args:
+        store_path: SQLite file
+        fingerprint: Fingerprint of the data and model used
+        chunks: Iterable of forecast DataFrames (store_nbr, item_nbr, date,
+            predicted_sales); each series sits in a single chunk, in date
+            order starting the day after its cutoff
+
+    Returns:
+        Number of rows written
+    """
+    n_rows = 0
+    with closing(_connect(store_path)) as conn, conn:
+        conn.execute("DELETE FROM forecasts")
+        conn.execute("DELETE FROM meta WHERE key = 'fingerprint'")
+        for chunk in chunks:
+            dates = pd.to_datetime(chunk["date"])
+            cutoff = (
+                dates.groupby([chunk["store_nbr"], chunk["item_nbr"]]).transform("min")
+                - pd.Timedelta(days=1)
+            ).dt.strftime("%Y-%m-%d")
+            horizon = chunk.groupby(["store_nbr", "item_nbr"]).cumcount() + 1
+            rows = zip(
+                [fingerprint] * len(chunk),
+                chunk["store_nbr"].astype(int).tolist(),
+                chunk["item_nbr"].astype(int).tolist(),
+                cutoff.tolist(),
+                horizon.tolist(),
+                dates.dt.strftime("%Y-%m-%d").tolist(),
+                chunk["predicted_sales"].astype(float).tolist(),
+            )
+            conn.executemany("INSERT INTO forecasts VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            n_rows += len(chunk)
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('fingerprint', ?)", (fingerprint,)
+        )
+    return n_rows
+
+
+def read_forecast(store_path, fingerprint, store_nbr, item_nbr, cutoff, n_days):
+    """Read a precomputed forecast from the store.
+
+    Args:
+        store_path: SQLite file
+        fingerprint: Fingerprint of the current data and model
+        store_nbr: Store number
+        item_nbr: Item number
+        cutoff: Last history date of the forecast
+        n_days: Number of forecast days
+
+    Returns:
+        DataFrame with date and predicted_sales, or None on a cache miss
+    """
+    try:
+        conn = sqlite3.connect(f"file:{store_path}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        return None
+
+    with closing(conn):
+        try:
+            rows = conn.execute(
+                "SELECT date, predicted_sales FROM forecasts "
+                "WHERE fingerprint = ? AND store_nbr = ? AND item_nbr = ? "
+                "AND cutoff = ? AND horizon <= ? ORDER BY horizon",
+                (
+                    fingerprint,
+                    int(store_nbr),
+                    int(item_nbr),
+                    pd.Timestamp(cutoff).strftime("%Y-%m-%d"),
+                    int(n_days),
+                ),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return None
+
+    if len(rows) < n_days:
+        return None
+    forecast_df = pd.DataFrame(rows, columns=["date", "predicted_sales"])
+    forecast_df["date"] = pd.to_datetime(forecast_df["date"])
+    return forecast_df
@@ -1,5 +1,6 @@
 """Data loading and feature engineering utilities."""
 
+import numpy as np
 import pandas as pd
 
 
@@ -59,8 +60,8 @@ def get_history(df, store_nbr, item_nbr, end_date=None, days=180):
         DataFrame with historical data
     """
     mask = (df["store_nbr"] == store_nbr) & (df["item_nbr"] == item_nbr)
-    history = df[mask].copy()
-    history = history.sort_values("date")
+    # Boolean indexing and sort_values both return new frames, no copy needed
+    history = df[mask].sort_values("date")
 
     if end_date is not None:
         history = history[history["date"] <= pd.Timestamp(end_date)]
@@ -84,3 +85,104 @@ def generate_forecast_dates(start_date, n_days):
     """
     dates = pd.date_range(start=start_date, periods=n_days, freq="D")
     return dates.tolist()
+
+
+def parse_promo_calendar(spec, n_days):
+    """Parse a promotion calendar such as "3-7, 10" into daily flags.
+
+    Days are 1-based forecast days. "none" (or an empty string) means no
+    promotion and "all" means a promotion on every day.
+
+    Args:
+        spec: Calendar text
+        n_days: Number of forecast days
+
+    Returns:
+        Array of 0/1 flags (n_days,)
+    """
+    calendar = np.zeros(n_days, dtype=np.int64)
+    spec = spec.strip().lower()
+    if spec in ("", "none"):
+        return calendar
+    if spec == "all":
+        calendar[:] = 1
+        return calendar
+
+    for part in spec.split(","):
+        bounds = part.strip().split("-")
+        if len(bounds) > 2 or not all(b.strip().isdigit() for b in bounds):
+            raise ValueError(f"Invalid promotion days: {part.strip()!r}")
+        first, last = int(bounds[0]), int(bounds[-1])
+        if not 1 <= first <= last <= n_days:
+            raise ValueError(
+                f"Promotion days must be within 1-{n_days}: {part.strip()!r}"
+            )
+        calendar[first - 1 : last] = 1
+    return calendar
+
+
+def parse_promo_scenarios(text, n_days):
+    """Parse one "name: days" promotion scenario per line.
+
+    Args:
+        text: Scenario lines, e.g. "No promo: none" or "Promo week: 3-7"
+        n_days: Number of forecast days
+
+    Returns:
+        Dictionary of scenario name -> 0/1 array (n_days,), in input order
+    """
+    scenarios = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        name, sep, spec = line.partition(":")
+        if not sep or not name.strip():
+            raise ValueError(f"Expected 'name: days', got {line.strip()!r}")
+        scenarios[name.strip()] = parse_promo_calendar(spec, n_days)
+    return scenarios
+
+
+def build_series_matrix(df, feature_columns, end_date=None, days=180):
+    """Lay out per-series history as flat NumPy arrays.
+
+    Rows of every store-item pair are stored contiguously (sorted by date),
+    so series ``i`` occupies rows ``offsets[i]:offsets[i + 1]``. The arrays
+    are plain buffers that can be placed in shared memory and handed to
+    worker processes without re-reading the source data.
+
+    Args:
+        df: Sample data DataFrame
+        feature_columns: Feature names (column order of the matrix)
+        end_date: End date for history (default: latest)
+        days: Number of days of history to keep per series
+
+    Returns:
+        Dictionary of arrays: keys (n_series, 2) store/item numbers,
+        offsets (n_series + 1), features (n_rows, n_features) float32,
+        sales (n_rows,) and last_dates (n_series,)
+    """
+    history = df
+    if end_date is not None:
+        history = history[history["date"] <= pd.Timestamp(end_date)]
+
+    history = history.sort_values(["store_nbr", "item_nbr", "date"])
+    history = history.groupby(["store_nbr", "item_nbr"], sort=False).tail(days)
+
+    keys, counts = np.unique(
+        history[["store_nbr", "item_nbr"]].to_numpy(dtype=np.int64),
+        axis=0,
+        return_counts=True,
+    )
+    offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    dates = history["date"].to_numpy(dtype="datetime64[ns]")
+    last_dates = dates[offsets[1:] - 1] if len(keys) else dates[:0]
+
+    return {
+        "keys": keys.reshape(-1, 2),
+        "offsets": offsets,
+        "features": history[feature_columns].to_numpy(dtype=np.float32),
+        "sales": history["unit_sales"].to_numpy(dtype=np.float64),
+        "last_dates": last_dates,
+    }
@@ -0,0 +1,125 @@
+"""Streaming export of forecast results to CSV or Parquet."""
+
+from contextlib import nullcontext
+import gzip
+from pathlib import Path
+import time
+
+import pandas as pd
+
+# Leading columns of every export; any extra columns (e.g. intervals) follow
+EXPORT_COLUMNS = ["date", "store_nbr", "item_nbr", "family", "predicted_sales"]
+
+EXPORT_FORMATS = {
+    "csv": {"extension": "csv", "mime": "text/csv"},
+    "csv.gz": {"extension": "csv.gz", "mime": "application/gzip"},
+    "parquet": {"extension": "parquet", "mime": "application/vnd.apache.parquet"},
+}
+
+
+def order_export_columns(chunk):
+    """Put the standard export columns first, keeping any extras after them."""
+    leading = [col for col in EXPORT_COLUMNS if col in chunk.columns]
+    extra = [col for col in chunk.columns if col not in leading]
+    return chunk[leading + extra]
+
+
+def write_forecast_export(chunks, dest, fmt="csv"):
+    """Write forecast DataFrames chunk by chunk.
+
+    Only one chunk is held in memory at a time, so full-catalog forecasts
+    can be exported without building the whole result set first.
+
+    Args:
+        chunks: Iterable of forecast DataFrames with identical columns
+        dest: Output path or writable binary file object
+        fmt: One of EXPORT_FORMATS ("csv", "csv.gz", "parquet")
+
+    Returns:
+        Number of rows written
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    if fmt == "parquet":
+        return _write_parquet(chunks, dest)
+
+    n_rows = 0
+    header = True
+    with _open_binary(dest, compress=fmt == "csv.gz") as f:
+        for chunk in chunks:
+            chunk = order_export_columns(chunk)
+            f.write(chunk.to_csv(index=False, header=header).encode("utf-8"))
+            header = False
+            n_rows += len(chunk)
+        if header:
+            f.write((",".join(EXPORT_COLUMNS) + "\n").encode("utf-8"))
+    return n_rows
+
+
+def _open_binary(dest, compress):
+    """Open dest for binary writing, optionally gzip-compressed."""
+    if compress:
+        if hasattr(dest, "write"):
+            return gzip.GzipFile(fileobj=dest, mode="wb")
+        return gzip.open(dest, "wb")
+    if hasattr(dest, "write"):
+        return nullcontext(dest)
+    return open(dest, "wb")
+
+
+def _write_parquet(chunks, dest):
+    """Write chunks as row groups of one zstd-compressed Parquet file."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export requires pyarrow") from e
+
+    n_rows = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(
+                order_export_columns(chunk), preserve_index=False
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(dest, table.schema, compression="zstd")
+            writer.write_table(table.cast(writer.schema))
+            n_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # No chunks: still produce a readable, empty file
+        empty = pd.DataFrame(columns=EXPORT_COLUMNS)
+        pq.write_table(pa.Table.from_pandas(empty, preserve_index=False), dest)
+    return n_rows
+
+
+def sweep_exports(directory, max_age_seconds):
+    """Delete export files not modified within ``max_age_seconds``.
+
+    Args:
+        directory: Directory holding temporary export files
+        max_age_seconds: Age after which a file is removed
+
+    Returns:
+        Number of files removed
+    """
+    directory = Path(directory)
+    if not directory.is_dir():
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    n_removed = 0
+    for path in directory.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                n_removed += 1
+        except FileNotFoundError:
+            # Removed by a concurrent sweep
+            continue
+    return n_removed
@@ -0,0 +1,66 @@
+"""Shared-memory helpers for multi-process forecasting.
+
+The parent process publishes the series matrix (see
+``data_utils.build_series_matrix``) once; workers attach zero-copy NumPy
+views to the same blocks, so memory stays flat as workers are added.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def publish_arrays(arrays):
+    """Copy named arrays into shared memory blocks.
+
+    Args:
+        arrays: Dictionary of name -> NumPy array
+
+    Returns:
+        Tuple (blocks, spec). ``blocks`` are the SharedMemory handles owned
+        by the caller; ``spec`` is a picklable description for workers.
+    """
+    blocks = {}
+    spec = {}
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        # SharedMemory rejects size 0, keep at least one byte per block
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        blocks[name] = block
+        spec[name] = (block.name, array.shape, array.dtype.str)
+    return blocks, spec
+
+
+def attach_arrays(spec):
+    """Attach read-only NumPy views to published shared memory blocks.
+
+    Args:
+        spec: Description returned by ``publish_arrays``
+
+    Returns:
+        Tuple (blocks, views). Keep ``blocks`` alive while using ``views``.
+    """
+    blocks = {}
+    views = {}
+    for name, (block_name, shape, dtype) in spec.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        view.flags.writeable = False
+        blocks[name] = block
+        views[name] = view
+    return blocks, views
+
+
+def release_arrays(blocks, unlink=False):
+    """Close shared memory handles.
+
+    Args:
+        blocks: Handles returned by ``publish_arrays`` or ``attach_arrays``
+        unlink: Also free the memory (only the publishing process should)
+    """
+    for block in blocks.values():
+        block.close()
+        if unlink:
+            block.unlink()
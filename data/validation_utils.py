@@ -0,0 +1,214 @@
+"""Data-quality validation of the input files, run chunk by chunk.
+
+Checks the sample data against the model's feature list, per-series date
+order and continuity, NaN/inf values and consistency with the lookup table.
+Only one chunk and the last date of each series are held in memory, so the
+checks scale to files larger than memory (CSV and Parquet are read in
+chunks; pickles can only be loaded whole and are then sliced).
+
+The verdict is cached in a JSON file keyed by the hash of the inputs, so
+warm starts skip the scan.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.cache_utils import file_fingerprint
+
+KEY_COLUMNS = ["store_nbr", "item_nbr", "date"]
+TARGET_COLUMN = "unit_sales"
+
+
+def iter_data_chunks(data_path, chunk_rows=100_000):
+    """Read a sample data file a chunk of rows at a time.
+
+    Args:
+        data_path: .csv, .csv.gz, .parquet or .pkl file
+        chunk_rows: Rows per chunk
+
+    Returns:
+        Iterator of DataFrames
+    """
+    name = Path(data_path).name
+    if name.endswith((".csv", ".csv.gz")):
+        yield from pd.read_csv(data_path, chunksize=chunk_rows)
+    elif name.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet validation requires pyarrow") from e
+        for batch in pq.ParquetFile(data_path).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    elif name.endswith(".pkl"):
+        df = pd.read_pickle(data_path)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start : start + chunk_rows]
+    else:
+        raise ValueError(f"Unsupported data file: {data_path}")
+
+
+def validate_data(data_path, feature_columns, lookup_df=None, chunk_rows=100_000):
+    """Validate a sample data file chunk by chunk.
+
+    Args:
+        data_path: Sample data file (see ``iter_data_chunks``)
+        feature_columns: Feature names the model expects
+        lookup_df: Lookup DataFrame checked against the data series
+        chunk_rows: Rows per chunk
+
+    Returns:
+        Report dictionary with row/series counts, missing_columns,
+        nan_counts and inf_counts per column, out_of_order,
+        duplicate_dates, date_gaps, lookup_without_data,
+        data_without_lookup, and the resulting errors, warnings and valid
+    """
+    required = KEY_COLUMNS + [TARGET_COLUMN] + list(feature_columns)
+    numeric = [TARGET_COLUMN] + list(feature_columns)
+    report = {
+        "n_rows": 0,
+        "n_series": 0,
+        "missing_columns": [],
+        "nan_counts": {},
+        "inf_counts": {},
+        "out_of_order": 0,
+        "duplicate_dates": 0,
+        "date_gaps": 0,
+        "lookup_without_data": 0,
+        "data_without_lookup": 0,
+    }
+    nan_counts = pd.Series(0, index=["date"] + numeric, dtype=np.int64)
+    inf_counts = pd.Series(0, index=numeric, dtype=np.int64)
+    last_dates = None
+
+    for chunk in iter_data_chunks(data_path, chunk_rows):
+        if report["n_rows"] == 0:
+            report["missing_columns"] = [c for c in required if c not in chunk]
+            if report["missing_columns"]:
+                break
+        report["n_rows"] += len(chunk)
+
+        values = chunk[numeric].apply(pd.to_numeric, errors="coerce")
+        values = values.to_numpy(dtype=np.float64)
+        nan_counts[numeric] += np.isnan(values).sum(axis=0)
+        inf_counts[numeric] += np.isinf(values).sum(axis=0)
+
+        frame = pd.DataFrame(
+            {
+                "store_nbr": chunk["store_nbr"].to_numpy(),
+                "item_nbr": chunk["item_nbr"].to_numpy(),
+                "date": pd.to_datetime(chunk["date"], errors="coerce").to_numpy(),
+            }
+        )
+        nan_counts["date"] += frame["date"].isna().sum()
+        last_dates = _check_dates(frame, last_dates, report)
+
+    report["nan_counts"] = {k: int(v) for k, v in nan_counts.items() if v}
+    report["inf_counts"] = {k: int(v) for k, v in inf_counts.items() if v}
+
+    if last_dates is not None:
+        report["n_series"] = len(last_dates)
+        if lookup_df is not None:
+            data_pairs = last_dates.index
+            lookup_pairs = pd.MultiIndex.from_frame(
+                lookup_df[["store_nbr", "item_nbr"]]
+            )
+            report["lookup_without_data"] = int((~lookup_pairs.isin(data_pairs)).sum())
+            report["data_without_lookup"] = int((~data_pairs.isin(lookup_pairs)).sum())
+
+    report["errors"], report["warnings"] = _verdict(report)
+    report["valid"] = not report["errors"]
+    return report
+
+
+def _check_dates(frame, last_dates, report):
+    """Count date steps per series, carrying each series' last date over.
+
+    Args:
+        frame: Chunk with store_nbr, item_nbr and date
+        last_dates: Last date seen per series in earlier chunks (or None)
+        report: Report updated in place
+
+    Returns:
+        Last date seen per series, including this chunk
+    """
+    keys = ["store_nbr", "item_nbr"]
+    prev = frame.groupby(keys, sort=False)["date"].shift(1)
+    if last_dates is not None:
+        carried = last_dates.reindex(pd.MultiIndex.from_frame(frame[keys]))
+        prev = prev.fillna(pd.Series(carried.to_numpy(), index=frame.index))
+
+    step = (frame["date"] - prev).dt.days
+    report["out_of_order"] += int((step < 0).sum())
+    report["duplicate_dates"] += int((step == 0).sum())
+    report["date_gaps"] += int((step > 1).sum())
+
+    tail = frame.groupby(keys, sort=False).tail(1).set_index(keys)["date"]
+    return tail if last_dates is None else tail.combine_first(last_dates)
+
+
+def _verdict(report):
+    """Turn the counts of a report into error and warning messages."""
+    errors = []
+    warnings = []
+    if report["missing_columns"]:
+        errors.append(f"Missing columns: {', '.join(report['missing_columns'])}")
+    for col, count in report["nan_counts"].items():
+        errors.append(f"{count:,} missing values in {col}")
+    for col, count in report["inf_counts"].items():
+        errors.append(f"{count:,} infinite values in {col}")
+    if report["out_of_order"]:
+        errors.append(f"{report['out_of_order']:,} rows out of date order")
+    if report["duplicate_dates"]:
+        errors.append(f"{report['duplicate_dates']:,} duplicate series dates")
+    if report["lookup_without_data"]:
+        errors.append(f"{report['lookup_without_data']:,} lookup pairs have no data")
+    if report["date_gaps"]:
+        warnings.append(f"{report['date_gaps']:,} gaps in series dates")
+    if report["data_without_lookup"]:
+        warnings.append(
+            f"{report['data_without_lookup']:,} data series are not in the lookup"
+        )
+    return errors, warnings
+
+
+def validate_inputs(
+    data_path, lookup_path, features_path, cache_path=None, chunk_rows=100_000
+):
+    """Validate the app's input files, reusing a cached verdict if unchanged.
+
+    Args:
+        data_path: Sample data file
+        lookup_path: Lookup table CSV
+        features_path: feature_columns.json of the model
+        cache_path: JSON file holding the last verdict (no caching if None)
+        chunk_rows: Rows per chunk
+
+    Returns:
+        Report from ``validate_data`` with fingerprint and cached flag
+    """
+    fingerprint = file_fingerprint(data_path, lookup_path, features_path)
+    if cache_path is not None and Path(cache_path).exists():
+        try:
+            cached = json.loads(Path(cache_path).read_text())
+        except ValueError:
+            cached = {}
+        if cached.get("fingerprint") == fingerprint:
+            return {**cached["report"], "fingerprint": fingerprint, "cached": True}
+
+    with open(features_path) as f:
+        feature_columns = json.load(f)
+    report = validate_data(
+        data_path,
+        feature_columns,
+        lookup_df=pd.read_csv(lookup_path),
+        chunk_rows=chunk_rows,
+    )
+
+    if cache_path is not None:
+        Path(cache_path).write_text(
+            json.dumps({"fingerprint": fingerprint, "report": report}, indent=2)
+        )
+    return {**report, "fingerprint": fingerprint, "cached": False}
@@ -0,0 +1,211 @@
+"""Intermittent-demand fast path (TSB) for slow-moving series."""
+
+import numpy as np
+import pandas as pd
+
+from model.model_utils import forecast_batch
+
+
+def classify_series(lookup_df, max_avg_sales=2.5, min_cv=1.0, min_days=60):
+    """Flag intermittent series from lookup statistics.
+
+    A series is intermittent when it sells little on average, varies a lot
+    relative to its mean (coefficient of variation) and has enough history
+    for the estimator to settle.
+
+    Args:
+        lookup_df: Lookup DataFrame with avg_sales, std_sales, n_days
+        max_avg_sales: Highest average daily sales of an intermittent series
+        min_cv: Lowest std_sales / avg_sales of an intermittent series
+        min_days: Minimum number of history days
+
+    Returns:
+        Copy of lookup_df with ``cv`` and ``intermittent`` columns
+    """
+    result = lookup_df.copy()
+    avg = result["avg_sales"].to_numpy(dtype=np.float64)
+    std = result["std_sales"].to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result["cv"] = np.where(avg > 0, std / avg, np.inf)
+    result["intermittent"] = (
+        (result["avg_sales"] <= max_avg_sales)
+        & (result["cv"] >= min_cv)
+        & (result["n_days"] >= min_days)
+    )
+    return result
+
+
+def intermittent_mask(arrays, classified_df):
+    """Align the ``intermittent`` flags of classify_series to a series matrix.
+
+    Args:
+        arrays: Series matrix from ``build_series_matrix``
+        classified_df: Output of ``classify_series``
+
+    Returns:
+        Boolean array (n_series,); series missing from the lookup are False
+    """
+    flagged = classified_df.loc[
+        classified_df["intermittent"], ["store_nbr", "item_nbr"]
+    ]
+    flagged = set(map(tuple, flagged.to_numpy(dtype=np.int64).tolist()))
+    return np.array(
+        [tuple(key) in flagged for key in arrays["keys"].tolist()], dtype=bool
+    )
+
+
+def sales_window(arrays, series_idx, window, skip=0):
+    """Right-aligned sales matrix for a subset of series.
+
+    Args:
+        arrays: Series matrix from ``build_series_matrix``
+        series_idx: Indices of the series to extract
+        window: Number of days per series
+        skip: Number of most recent days left out (the window ends before them)
+
+    Returns:
+        Array (len(series_idx), window); missing leading days are NaN
+    """
+    offsets = arrays["offsets"]
+    sales = arrays["sales"]
+    matrix = np.full((len(series_idx), window), np.nan)
+    for row, idx in enumerate(series_idx):
+        end = max(offsets[idx], offsets[idx + 1] - skip)
+        start = max(offsets[idx], end - window)
+        values = sales[start:end]
+        if len(values):
+            matrix[row, -len(values) :] = values
+    return matrix
+
+
+def tsb_forecast(sales, alpha=0.1, beta=0.1):
+    """Teunter-Syntetos-Babai forecast for many series at once.
+
+    TSB smooths demand size (alpha) and demand probability (beta) and
+    forecasts their product, a flat level for every future day. The update
+    loop runs over time; all series are updated together in each step.
+
+    Args:
+        sales: Array (n_series, n_days), oldest first; NaN marks no data
+        alpha: Smoothing factor for demand size
+        beta: Smoothing factor for demand probability
+
+    Returns:
+        Forecast level per series (n_series,)
+    """
+    sales = np.asarray(sales, dtype=np.float64)
+    observed = ~np.isnan(sales)
+    nonzero = observed & (sales > 0)
+
+    n_observed = observed.sum(axis=1)
+    n_nonzero = nonzero.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        prob = np.where(n_observed > 0, n_nonzero / n_observed, 0.0)
+        size = np.where(
+            n_nonzero > 0, np.where(nonzero, sales, 0).sum(axis=1) / n_nonzero, 0.0
+        )
+
+    for t in range(sales.shape[1]):
+        demand = sales[:, t]
+        seen = observed[:, t]
+        hit = nonzero[:, t]
+        prob = np.where(seen, prob + beta * (hit - prob), prob)
+        size = np.where(hit, size + alpha * (demand - size), size)
+
+    return np.maximum(prob * size, 0.0)
+
+
+def backtest_tsb(sales, holdout, alpha=0.1, beta=0.1):
+    """Mean absolute error of TSB on the last ``holdout`` days.
+
+    Args:
+        sales: Array (n_series, n_days), oldest first; NaN marks no data
+        holdout: Number of trailing days held out for evaluation
+        alpha: Smoothing factor for demand size
+        beta: Smoothing factor for demand probability
+
+    Returns:
+        MAE per series (n_series,)
+    """
+    sales = np.asarray(sales, dtype=np.float64)
+    level = tsb_forecast(sales[:, :-holdout], alpha=alpha, beta=beta)
+    actual = sales[:, -holdout:]
+    return np.nanmean(np.abs(actual - level[:, None]), axis=1)
+
+
+def routing_report(
+    lookup_df,
+    arrays,
+    intermittent,
+    holdout=30,
+    tsb_history_days=120,
+    model=None,
+    feature_columns=None,
+):
+    """Record which series take the fast path and how accurate TSB is there.
+
+    Both methods forecast the last ``holdout`` days from the same start, the
+    way they run in production: TSB as a flat level fitted on the
+    ``tsb_history_days`` before the holdout, the model as an autoregressive
+    rollout from the last row before it. Series rows are assumed to be
+    consecutive days.
+
+    Args:
+        lookup_df: Output of ``classify_series``
+        arrays: Series matrix from ``build_series_matrix``
+        intermittent: Boolean mask over the series of ``arrays``
+        holdout: Number of trailing days used for the backtest
+        tsb_history_days: Number of days TSB is fitted on
+        model: Trained XGBoost model; when given, its rollout MAE on the
+            same holdout days is added for comparison
+        feature_columns: Feature names of the model
+
+    Returns:
+        DataFrame with store_nbr, item_nbr, method, tsb_holdout_mae
+        (and xgb_holdout_mae), avg_sales and cv
+    """
+    n_series = len(arrays["keys"])
+    report = pd.DataFrame(arrays["keys"], columns=["store_nbr", "item_nbr"])
+    report["method"] = np.where(intermittent, "tsb", "xgboost")
+    report["tsb_holdout_mae"] = backtest_tsb(
+        sales_window(arrays, range(n_series), tsb_history_days + holdout), holdout
+    )
+
+    if model is not None:
+        report["xgb_holdout_mae"] = _backtest_rollout(
+            model, arrays, holdout, feature_columns
+        )
+
+    stats = lookup_df[["store_nbr", "item_nbr", "avg_sales", "cv"]]
+    return report.merge(stats, on=["store_nbr", "item_nbr"], how="left")
+
+
+def _backtest_rollout(model, arrays, holdout, feature_columns):
+    """MAE per series of a model rollout over the last ``holdout`` days.
+
+    Series sharing a start date and recent-sales length are rolled out
+    together; series without a row before the holdout get NaN.
+    """
+    offsets = arrays["offsets"]
+    cuts = offsets[1:] - holdout
+    n_recent = np.minimum(cuts - offsets[:-1], 30)
+    cutoffs = pd.DatetimeIndex(arrays["last_dates"]) - pd.Timedelta(days=holdout)
+    mae = np.full(len(cuts), np.nan)
+
+    valid = np.flatnonzero(n_recent > 0)
+    groups = pd.DataFrame(
+        {"cutoff": cutoffs[valid], "n_recent": n_recent[valid], "idx": valid}
+    ).groupby(["cutoff", "n_recent"])
+    for (cutoff, window), group in groups:
+        idx = group["idx"].to_numpy()
+        predictions = forecast_batch(
+            model,
+            arrays["features"][cuts[idx] - 1],
+            sales_window(arrays, idx, window, skip=holdout),
+            cutoff,
+            feature_columns,
+            holdout,
+        )
+        actual = sales_window(arrays, idx, holdout)
+        mae[idx] = np.mean(np.abs(predictions - actual), axis=1)
+    return mae
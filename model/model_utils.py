@@ -2,6 +2,11 @@
 
 import joblib
 import json
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
 
 
 def load_model(model_path):
@@ -72,3 +77,257 @@ def predict(model, scaler, X):
     predictions = model.predict(X_scaled)
 
     return predictions
+
+
+def autoregressive_forecast(
+    model, history, feature_columns, n_days, iteration_range=None
+):
+    """
+    Generate multi-day forecast with autoregressive updates.
+
+    Each prediction updates lag features for the next prediction:
+    - lag1 becomes the new prediction
+    - lag7 shifts by 1 day
+    - Rolling averages update with new value
+
+    Pass ``iteration_range`` (e.g. ``(0, 100)``) to predict with only the
+    first trees of the model for fast interactive previews.
+    """
+    # Get initial feature values from latest history row
+    X = history[feature_columns].tail(1).to_numpy(dtype=np.float32).flatten()
+
+    return forecast_from_arrays(
+        model,
+        X,
+        history["unit_sales"].to_numpy()[-30:],
+        history["date"].max(),
+        feature_columns,
+        n_days,
+        iteration_range=iteration_range,
+    )
+
+
+def forecast_from_arrays(
+    model, X, recent_sales, last_date, feature_columns, n_days, iteration_range=None
+):
+    """Autoregressive forecast from raw arrays instead of a history DataFrame.
+
+    This is the core used by ``autoregressive_forecast`` and by worker
+    processes that attach to a shared feature matrix.
+
+    Args:
+        model: Trained XGBoost model
+        X: Feature vector of the latest history row (n_features,)
+        recent_sales: Most recent unit sales, oldest first (up to 30 values)
+        last_date: Date of the latest history row
+        feature_columns: Feature names matching the order of X
+        n_days: Number of days to forecast
+        iteration_range: Tree range to predict with (default: all trees)
+
+    Returns:
+        List of predictions
+    """
+    predictions = forecast_batch(
+        model,
+        np.asarray(X).reshape(1, -1),
+        np.asarray(recent_sales, dtype=np.float64).reshape(1, -1),
+        last_date,
+        feature_columns,
+        n_days,
+        iteration_range=iteration_range,
+    )
+    return predictions[0].tolist()
+
+
+def forecast_batch(
+    model,
+    X,
+    recent_sales,
+    last_date,
+    feature_columns,
+    n_days,
+    overrides=None,
+    iteration_range=None,
+):
+    """Autoregressive forecast for several feature rows rolled out together.
+
+    Each day, all rows are predicted in a single ``model.predict`` call, so
+    the cost of a rollout barely grows with the number of rows.
+
+    Args:
+        model: Trained XGBoost model
+        X: Feature rows to start from (n_rows, n_features)
+        recent_sales: Most recent unit sales per row, oldest first
+            (n_rows, up to 30)
+        last_date: Date of the latest history row
+        feature_columns: Feature names matching the columns of X
+        n_days: Number of days to forecast
+        overrides: Dictionary of feature -> values (n_rows, n_days) set
+            before each day's prediction (e.g. a promotion calendar)
+        iteration_range: Tree range to predict with (default: all trees)
+
+    Returns:
+        Predictions array (n_rows, n_days)
+    """
+    predict_kwargs = {}
+    if iteration_range is not None:
+        predict_kwargs["iteration_range"] = iteration_range
+
+    X = np.array(X, dtype=np.float32)
+    predictions = np.zeros((X.shape[0], n_days))
+
+    # Create feature index map for easy updates
+    feat_idx = {col: i for i, col in enumerate(feature_columns)}
+    overrides = {col: np.asarray(values) for col, values in (overrides or {}).items()}
+
+    # Track recent predictions for rolling calculations
+    recent_sales = np.asarray(recent_sales, dtype=np.float64)[:, -30:]
+
+    for day in range(n_days):
+        for col, values in overrides.items():
+            if col in feat_idx:
+                X[:, feat_idx[col]] = values[:, day]
+
+        # Predict
+        pred = np.asarray(model.predict(X, **predict_kwargs), dtype=np.float64)
+        pred = np.maximum(pred, 0)  # No negative sales
+        predictions[:, day] = pred
+
+        # Update features for next prediction (autoregressive)
+        if day < n_days - 1:
+            # Add prediction to recent sales
+            recent_sales = np.concatenate([recent_sales, pred[:, None]], axis=1)
+            recent_sales = recent_sales[:, -30:]
+            n_recent = recent_sales.shape[1]
+
+            # Update lag features
+            if "unit_sales_lag1" in feat_idx:
+                X[:, feat_idx["unit_sales_lag1"]] = pred
+
+            # Update rolling averages
+            if "unit_sales_7d_avg" in feat_idx and n_recent >= 7:
+                X[:, feat_idx["unit_sales_7d_avg"]] = recent_sales[:, -7:].mean(axis=1)
+            if "unit_sales_14d_avg" in feat_idx and n_recent >= 14:
+                X[:, feat_idx["unit_sales_14d_avg"]] = recent_sales[:, -14:].mean(
+                    axis=1
+                )
+            if "unit_sales_30d_avg" in feat_idx and n_recent >= 30:
+                X[:, feat_idx["unit_sales_30d_avg"]] = recent_sales.mean(axis=1)
+
+            # Update calendar features
+            next_date = pd.Timestamp(last_date) + timedelta(days=day + 1)
+            if "dayofweek" in feat_idx:
+                X[:, feat_idx["dayofweek"]] = next_date.dayofweek
+            if "day" in feat_idx:
+                X[:, feat_idx["day"]] = next_date.day
+            if "month" in feat_idx:
+                X[:, feat_idx["month"]] = next_date.month
+            if "weekend" in feat_idx:
+                X[:, feat_idx["weekend"]] = 1 if next_date.dayofweek >= 5 else 0
+
+    return predictions
+
+
+def forecast_promo_scenarios(
+    model, history, feature_columns, promo_calendars, iteration_range=None
+):
+    """Forecast one series under several promotion calendars at once.
+
+    Scenarios are stacked as rows of one feature matrix and rolled out
+    together (see ``forecast_batch``), so ten scenarios cost about as much
+    as one. ``onpromotion`` follows each calendar and
+    ``promo_item_interaction`` is set to ``onpromotion * item_avg_sales``.
+
+    Args:
+        model: Trained XGBoost model
+        history: Historical data for the series
+        feature_columns: Feature names
+        promo_calendars: Dictionary of scenario name -> 0/1 array (n_days,)
+        iteration_range: Tree range to predict with (default: all trees)
+
+    Returns:
+        DataFrame with one column of predictions per scenario
+    """
+    names = list(promo_calendars)
+    calendars = np.array([promo_calendars[name] for name in names], dtype=np.float32)
+    n_days = calendars.shape[1]
+
+    latest = history[feature_columns].tail(1).to_numpy(dtype=np.float32)
+    X = np.repeat(latest, len(names), axis=0)
+    recent_sales = np.repeat(
+        history["unit_sales"].to_numpy(dtype=np.float64)[None, -30:], len(names), axis=0
+    )
+
+    overrides = {"onpromotion": calendars}
+    if "item_avg_sales" in feature_columns:
+        item_avg = latest[0, feature_columns.index("item_avg_sales")]
+        overrides["promo_item_interaction"] = calendars * item_avg
+
+    predictions = forecast_batch(
+        model,
+        X,
+        recent_sales,
+        history["date"].max(),
+        feature_columns,
+        n_days,
+        overrides=overrides,
+        iteration_range=iteration_range,
+    )
+    return pd.DataFrame(predictions.T, columns=names)
+
+
+def evaluate_fast_inference(model, df, feature_columns, n_trees, n_days=30, n_series=5):
+    """Measure the cost and speed of predicting with the first ``n_trees`` trees.
+
+    Accuracy is compared on every row of ``df``. The speedup is timed on
+    what the app actually runs: day-by-day ``autoregressive_forecast``
+    rollouts of single series, where per-call overhead dominates and the
+    gain is much smaller than for one bulk predict.
+
+    Args:
+        model: Trained XGBoost model
+        df: Sample data DataFrame (store_nbr, item_nbr, date, features and
+            unit_sales)
+        feature_columns: Feature names
+        n_trees: Number of trees used by the fast mode
+        n_days: Number of days per timed rollout
+        n_series: Number of series rolled out for the timing
+
+    Returns:
+        Dictionary with n_trees, total_trees, rmse_full, rmse_fast,
+        mae_vs_full and speedup
+    """
+    X = df[feature_columns].to_numpy(dtype=np.float32)
+    y = df["unit_sales"].to_numpy(dtype=np.float64)
+    total_trees = model.get_booster().num_boosted_rounds()
+    n_trees = min(n_trees, total_trees)
+
+    full = np.maximum(model.predict(X), 0)
+    fast = np.maximum(model.predict(X, iteration_range=(0, n_trees)), 0)
+
+    histories = [
+        history.sort_values("date")
+        for _, history in df.groupby(["store_nbr", "item_nbr"], sort=False)
+    ][:n_series]
+
+    full_seconds = 0.0
+    fast_seconds = 0.0
+    for history in histories:
+        start = time.perf_counter()
+        autoregressive_forecast(model, history, feature_columns, n_days)
+        full_seconds += time.perf_counter() - start
+
+        start = time.perf_counter()
+        autoregressive_forecast(
+            model, history, feature_columns, n_days, iteration_range=(0, n_trees)
+        )
+        fast_seconds += time.perf_counter() - start
+
+    return {
+        "n_trees": n_trees,
+        "total_trees": total_trees,
+        "rmse_full": float(np.sqrt(np.mean((full - y) ** 2))),
+        "rmse_fast": float(np.sqrt(np.mean((fast - y) ** 2))),
+        "mae_vs_full": float(np.mean(np.abs(fast - full))),
+        "speedup": full_seconds / max(fast_seconds, 1e-9),
+    }
@@ -0,0 +1,96 @@
+"""Tests for the batch forecasting entry point."""
+
+import joblib
+import numpy as np
+import pytest
+from xgboost import XGBRegressor
+
+from app.batch import forecast_all
+
+FEATURES = ["unit_sales_lag1", "unit_sales_7d_avg", "dayofweek"]
+
+
+@pytest.fixture
+def series_arrays():
+    """Series matrix with five series of different lengths."""
+    rng = np.random.default_rng(0)
+    lengths = [40, 35, 60, 45, 50]
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+    sales = rng.poisson(5, offsets[-1]).astype(np.float64)
+    return {
+        "keys": np.array([[1, 100 + i] for i in range(len(lengths))], dtype=np.int64),
+        "offsets": offsets,
+        "features": rng.random((offsets[-1], len(FEATURES)), dtype=np.float32) * 10,
+        "sales": sales,
+        "last_dates": np.array(["2017-08-15"] * len(lengths), dtype="datetime64[ns]"),
+    }
+
+
+@pytest.fixture
+def model_path(series_arrays, tmp_path):
+    """Small XGBoost model saved the way worker processes load it."""
+    model = XGBRegressor(n_estimators=5, max_depth=2)
+    model.fit(series_arrays["features"], series_arrays["sales"])
+    path = tmp_path / "model.pkl"
+    joblib.dump(model, path)
+    return path
+
+
+class TestForecastAll:
+    """Tests for forecast_all function."""
+
+    def test_series_order_with_mixed_routing(self, series_arrays, model_path):
+        """Should yield every series in order, TSB ones as flat levels."""
+        intermittent = np.array([True, False, True, False, False])
+        results = list(
+            forecast_all(
+                series_arrays,
+                7,
+                model=joblib.load(model_path),
+                feature_columns=FEATURES,
+                intermittent=intermittent,
+            )
+        )
+        assert [idx for idx, _ in results] == [0, 1, 2, 3, 4]
+        assert all(len(predictions) == 7 for _, predictions in results)
+        for idx in np.flatnonzero(intermittent):
+            assert len(set(results[idx][1])) == 1
+
+    def test_workers_match_single_process(self, series_arrays, model_path):
+        """Should produce the same forecasts with a worker pool."""
+        intermittent = np.array([False, True, False, False, True])
+        single = list(
+            forecast_all(
+                series_arrays,
+                7,
+                model=joblib.load(model_path),
+                feature_columns=FEATURES,
+                intermittent=intermittent,
+            )
+        )
+        pooled = list(
+            forecast_all(
+                series_arrays,
+                7,
+                model_path=model_path,
+                feature_columns=FEATURES,
+                workers=2,
+                intermittent=intermittent,
+            )
+        )
+        assert [idx for idx, _ in pooled] == [idx for idx, _ in single]
+        for (_, expected), (_, actual) in zip(single, pooled):
+            np.testing.assert_allclose(actual, expected)
+
+    def test_all_intermittent_skips_model(self, series_arrays):
+        """Should not need a model when every series is routed to TSB."""
+        results = list(
+            forecast_all(
+                series_arrays,
+                3,
+                model_path="missing.pkl",
+                feature_columns=FEATURES,
+                intermittent=np.ones(5, dtype=bool),
+            )
+        )
+        assert [idx for idx, _ in results] == [0, 1, 2, 3, 4]
@@ -0,0 +1,94 @@
+"""Tests for cache_utils module."""
+
+import pandas as pd
+import pytest
+
+from data.cache_utils import (
+    file_fingerprint,
+    get_store_fingerprint,
+    write_forecast_store,
+    read_forecast,
+)
+
+
+@pytest.fixture
+def forecast_chunks():
+    """Two 5-day forecasts split across two chunks."""
+    return [
+        pd.DataFrame(
+            {
+                "date": pd.date_range("2024-02-01", periods=5, freq="D"),
+                "store_nbr": store_nbr,
+                "item_nbr": 100,
+                "predicted_sales": [float(store_nbr * 10 + i) for i in range(5)],
+            }
+        )
+        for store_nbr in (1, 2)
+    ]
+
+
+class TestFileFingerprint:
+    """Tests for file_fingerprint function."""
+
+    def test_changes_with_content(self, tmp_path):
+        """Should change when a file's contents change."""
+        path = tmp_path / "data.csv"
+        path.write_text("a,b\n1,2\n")
+        before = file_fingerprint(path)
+        path.write_text("a,b\n1,3\n")
+        assert file_fingerprint(path) != before
+
+    def test_independent_of_block_size(self, tmp_path):
+        """Should give the same digest however the file is read."""
+        path = tmp_path / "data.bin"
+        path.write_bytes(bytes(range(256)) * 10)
+        assert file_fingerprint(path, block_size=7) == file_fingerprint(path)
+
+
+class TestForecastStore:
+    """Tests for the precomputed forecast store."""
+
+    def test_round_trip(self, tmp_path, forecast_chunks):
+        """Should return the stored forecast for a matching request."""
+        store = tmp_path / "store.sqlite"
+        n_rows = write_forecast_store(store, "abc", forecast_chunks)
+
+        result = read_forecast(store, "abc", 2, 100, "2024-01-31", 3)
+        assert n_rows == 10
+        assert result["predicted_sales"].tolist() == [20.0, 21.0, 22.0]
+        assert result["date"].iloc[0] == pd.Timestamp("2024-02-01")
+
+    def test_records_fingerprint(self, tmp_path, forecast_chunks):
+        """Should remember which fingerprint the store was built for."""
+        store = tmp_path / "store.sqlite"
+        assert get_store_fingerprint(store) is None
+        write_forecast_store(store, "abc", forecast_chunks)
+        assert get_store_fingerprint(store) == "abc"
+
+    def test_miss_on_stale_fingerprint(self, tmp_path, forecast_chunks):
+        """Should not serve forecasts built from other data or model."""
+        store = tmp_path / "store.sqlite"
+        write_forecast_store(store, "abc", forecast_chunks)
+        assert read_forecast(store, "xyz", 1, 100, "2024-01-31", 3) is None
+
+    def test_miss_on_other_cutoff_or_long_horizon(self, tmp_path, forecast_chunks):
+        """Should miss when the cutoff differs or the horizon is not stored."""
+        store = tmp_path / "store.sqlite"
+        write_forecast_store(store, "abc", forecast_chunks)
+        assert read_forecast(store, "abc", 1, 100, "2024-01-30", 3) is None
+        assert read_forecast(store, "abc", 1, 100, "2024-01-31", 6) is None
+
+    def test_rebuild_replaces_rows(self, tmp_path, forecast_chunks):
+        """Should drop forecasts of the previous build."""
+        store = tmp_path / "store.sqlite"
+        write_forecast_store(store, "abc", forecast_chunks)
+        write_forecast_store(store, "def", forecast_chunks[:1])
+        assert read_forecast(store, "abc", 1, 100, "2024-01-31", 1) is None
+        assert read_forecast(store, "def", 2, 100, "2024-01-31", 1) is None
+        assert read_forecast(store, "def", 1, 100, "2024-01-31", 1) is not None
+
+    def test_missing_store_is_a_miss(self, tmp_path):
+        """Should fall back (None) when the store file does not exist."""
+        store = tmp_path / "missing.sqlite"
+        assert read_forecast(store, "abc", 1, 100, "2024-01-31", 1) is None
+        assert not store.exists()
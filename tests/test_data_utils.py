@@ -1,6 +1,7 @@
 """Tests for data_utils module."""
 
 import pytest
+import numpy as np
 import pandas as pd
 
 from data.data_utils import (
@@ -8,6 +9,9 @@ from data.data_utils import (
     get_items_for_store,
     get_history,
     generate_forecast_dates,
+    build_series_matrix,
+    parse_promo_calendar,
+    parse_promo_scenarios,
 )
 
 
@@ -137,3 +141,71 @@ class TestGenerateForecastDates:
         dates = generate_forecast_dates("2024-06-15", 1)
         assert len(dates) == 1
         assert dates[0] == pd.Timestamp("2024-06-15")
+
+
+class TestBuildSeriesMatrix:
+    """Tests for build_series_matrix function."""
+
+    def test_offsets_cover_each_series(self, sample_sales_df):
+        """Should lay out each series contiguously."""
+        arrays = build_series_matrix(sample_sales_df, ["unit_sales"])
+        np.testing.assert_array_equal(arrays["keys"], [[1, 100], [2, 100]])
+        np.testing.assert_array_equal(arrays["offsets"], [0, 60, 120])
+        assert arrays["features"].shape == (120, 1)
+        assert arrays["features"].dtype == np.float32
+
+    def test_matches_get_history(self, sample_sales_df):
+        """Should hold the same rows as get_history for each series."""
+        arrays = build_series_matrix(
+            sample_sales_df, ["unit_sales"], end_date="2024-02-10", days=30
+        )
+        history = get_history(sample_sales_df, 2, 100, end_date="2024-02-10", days=30)
+        start, end = arrays["offsets"][1], arrays["offsets"][2]
+        np.testing.assert_array_equal(arrays["sales"][start:end], history["unit_sales"])
+        assert arrays["last_dates"][1] == np.datetime64("2024-02-10")
+
+    def test_sorts_unordered_input(self, sample_sales_df):
+        """Should sort rows by date within each series."""
+        shuffled = sample_sales_df.sample(frac=1, random_state=0)
+        arrays = build_series_matrix(shuffled, ["unit_sales"])
+        np.testing.assert_array_equal(arrays["sales"][:60], np.arange(1, 61))
+
+
+class TestParsePromoCalendar:
+    """Tests for parse_promo_calendar function."""
+
+    def test_parses_ranges_and_days(self):
+        """Should flag 1-based days and inclusive ranges."""
+        calendar = parse_promo_calendar("2-3, 5", 6)
+        assert calendar.tolist() == [0, 1, 1, 0, 1, 0]
+
+    def test_none_and_all(self):
+        """Should support the none and all keywords."""
+        assert parse_promo_calendar("none", 3).tolist() == [0, 0, 0]
+        assert parse_promo_calendar("", 3).tolist() == [0, 0, 0]
+        assert parse_promo_calendar("All", 3).tolist() == [1, 1, 1]
+
+    def test_rejects_out_of_range(self):
+        """Should reject days outside the forecast horizon."""
+        with pytest.raises(ValueError):
+            parse_promo_calendar("5-9", 7)
+
+    def test_rejects_garbage(self):
+        """Should reject text that is not a day list."""
+        with pytest.raises(ValueError):
+            parse_promo_calendar("weekends", 7)
+
+
+class TestParsePromoScenarios:
+    """Tests for parse_promo_scenarios function."""
+
+    def test_parses_named_lines_in_order(self):
+        """Should return one calendar per line, keeping the input order."""
+        scenarios = parse_promo_scenarios("No promo: none\n\nEarly: 1-2\n", 3)
+        assert list(scenarios) == ["No promo", "Early"]
+        assert scenarios["Early"].tolist() == [1, 1, 0]
+
+    def test_requires_name(self):
+        """Should reject lines without a name."""
+        with pytest.raises(ValueError):
+            parse_promo_scenarios("3-7", 7)
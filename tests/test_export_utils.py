@@ -0,0 +1,107 @@
+"""Tests for export_utils module."""
+
+import gzip
+import io
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from data.export_utils import EXPORT_COLUMNS, sweep_exports, write_forecast_export
+
+
+def make_chunks(n_chunks=3, n_days=4):
+    """Create forecast chunks for consecutive items."""
+    return [
+        pd.DataFrame(
+            {
+                "predicted_sales": [float(i)] * n_days,
+                "date": pd.date_range("2024-01-01", periods=n_days, freq="D"),
+                "store_nbr": 1,
+                "item_nbr": 100 + i,
+                "family": "GROCERY",
+            }
+        )
+        for i in range(n_chunks)
+    ]
+
+
+class TestWriteForecastExport:
+    """Tests for write_forecast_export function."""
+
+    def test_csv_single_header(self, tmp_path):
+        """Should write the header once and every chunk's rows."""
+        path = tmp_path / "out.csv"
+        n_rows = write_forecast_export(make_chunks(), path)
+
+        result = pd.read_csv(path)
+        assert n_rows == 12
+        assert len(result) == 12
+        assert list(result.columns) == EXPORT_COLUMNS
+
+    def test_keeps_extra_columns_last(self, tmp_path):
+        """Should keep interval columns after the standard columns."""
+        chunks = [c.assign(lower=0.0, upper=1.0) for c in make_chunks()]
+        path = tmp_path / "out.csv"
+        write_forecast_export(chunks, path)
+
+        result = pd.read_csv(path)
+        assert list(result.columns) == EXPORT_COLUMNS + ["lower", "upper"]
+
+    def test_gzip_to_file_object(self):
+        """Should gzip into a caller-owned buffer without closing it."""
+        buffer = io.BytesIO()
+        write_forecast_export(make_chunks(), buffer, fmt="csv.gz")
+
+        assert not buffer.closed
+        result = pd.read_csv(io.BytesIO(gzip.decompress(buffer.getvalue())))
+        assert len(result) == 12
+
+    def test_consumes_generator_lazily(self, tmp_path):
+        """Should accept a generator of chunks."""
+        chunks = (chunk for chunk in make_chunks(5))
+        n_rows = write_forecast_export(chunks, tmp_path / "out.csv")
+        assert n_rows == 20
+
+    def test_empty_csv_has_header(self, tmp_path):
+        """Should write a header even without chunks."""
+        path = tmp_path / "out.csv"
+        write_forecast_export([], path)
+        assert list(pd.read_csv(path).columns) == EXPORT_COLUMNS
+
+    def test_parquet_round_trip(self, tmp_path):
+        """Should write all chunks into one Parquet file."""
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "out.parquet"
+        write_forecast_export(make_chunks(), path, fmt="parquet")
+
+        result = pd.read_parquet(path)
+        assert len(result) == 12
+        assert list(result.columns) == EXPORT_COLUMNS
+
+    def test_unknown_format(self, tmp_path):
+        """Should reject unknown formats."""
+        with pytest.raises(ValueError):
+            write_forecast_export(make_chunks(), tmp_path / "out.xlsx", fmt="xlsx")
+
+
+class TestSweepExports:
+    """Tests for sweep_exports function."""
+
+    def test_removes_only_old_files(self, tmp_path):
+        """Should delete files older than the age limit and keep new ones."""
+        old = tmp_path / "old.csv"
+        new = tmp_path / "new.csv"
+        old.write_text("x")
+        new.write_text("x")
+        an_hour_ago = time.time() - 3600
+        os.utime(old, (an_hour_ago, an_hour_ago))
+
+        assert sweep_exports(tmp_path, max_age_seconds=60) == 1
+        assert not old.exists()
+        assert new.exists()
+
+    def test_missing_directory(self, tmp_path):
+        """Should do nothing when no export was written yet."""
+        assert sweep_exports(tmp_path / "missing", max_age_seconds=60) == 0
@@ -0,0 +1,180 @@
+"""Tests for intermittent_utils module."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from model.intermittent_utils import (
+    classify_series,
+    intermittent_mask,
+    sales_window,
+    tsb_forecast,
+    backtest_tsb,
+    routing_report,
+)
+
+
+@pytest.fixture
+def sample_lookup_df():
+    """Lookup with one fast mover, one slow mover and one short series."""
+    return pd.DataFrame(
+        {
+            "store_nbr": [1, 1, 2],
+            "item_nbr": [100, 101, 100],
+            "avg_sales": [50.0, 0.5, 0.5],
+            "std_sales": [10.0, 1.0, 1.0],
+            "n_days": [182, 182, 20],
+        }
+    )
+
+
+@pytest.fixture
+def sample_arrays():
+    """Series matrix with series of length 4 and 2."""
+    return {
+        "keys": np.array([[1, 100], [1, 101]], dtype=np.int64),
+        "offsets": np.array([0, 4, 6], dtype=np.int64),
+        "sales": np.array([1.0, 2.0, 3.0, 4.0, 0.0, 5.0]),
+        "features": np.arange(12, dtype=np.float32).reshape(6, 2),
+        "last_dates": np.array(["2017-08-04", "2017-08-04"], dtype="datetime64[ns]"),
+    }
+
+
+class TestClassifySeries:
+    """Tests for classify_series function."""
+
+    def test_flags_slow_erratic_series(self, sample_lookup_df):
+        """Should flag low-volume, high-variation series with enough history."""
+        result = classify_series(sample_lookup_df)
+        assert result["intermittent"].tolist() == [False, True, False]
+
+    def test_zero_average_counts_as_erratic(self):
+        """Should treat a series that never sells as intermittent."""
+        lookup = pd.DataFrame({"avg_sales": [0.0], "std_sales": [0.0], "n_days": [182]})
+        assert classify_series(lookup)["intermittent"].tolist() == [True]
+
+    def test_does_not_modify_input(self, sample_lookup_df):
+        """Should return a copy."""
+        classify_series(sample_lookup_df)
+        assert "intermittent" not in sample_lookup_df.columns
+
+
+class TestIntermittentMask:
+    """Tests for intermittent_mask function."""
+
+    def test_aligns_to_matrix_keys(self, sample_lookup_df, sample_arrays):
+        """Should follow the series order of the matrix."""
+        classified = classify_series(sample_lookup_df)
+        mask = intermittent_mask(sample_arrays, classified)
+        np.testing.assert_array_equal(mask, [False, True])
+
+
+class TestSalesWindow:
+    """Tests for sales_window function."""
+
+    def test_right_aligns_and_pads(self, sample_arrays):
+        """Should keep the latest days and pad short series with NaN."""
+        matrix = sales_window(sample_arrays, [0, 1], 3)
+        np.testing.assert_array_equal(matrix[0], [2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(matrix[1], [np.nan, 0.0, 5.0])
+
+    def test_skips_trailing_days(self, sample_arrays):
+        """Should end the window before the skipped days."""
+        matrix = sales_window(sample_arrays, [0, 1], 2, skip=2)
+        np.testing.assert_array_equal(matrix[0], [1.0, 2.0])
+        assert np.isnan(matrix[1]).all()
+
+
+class TestTsbForecast:
+    """Tests for tsb_forecast function."""
+
+    def test_constant_demand(self):
+        """Should forecast the level of a constant series."""
+        result = tsb_forecast(np.full((1, 30), 3.0))
+        np.testing.assert_allclose(result, [3.0])
+
+    def test_never_sold(self):
+        """Should forecast zero for a series without sales."""
+        result = tsb_forecast(np.zeros((1, 30)))
+        np.testing.assert_array_equal(result, [0.0])
+
+    def test_half_probability(self):
+        """Should scale demand size by the probability of a sale."""
+        sales = np.tile([0.0, 4.0], 50).reshape(1, -1)
+        result = tsb_forecast(sales)
+        assert result[0] == pytest.approx(2.0, abs=0.2)
+
+    def test_ignores_nan_padding(self):
+        """Should give the same result with leading NaN padding."""
+        sales = np.array([[0.0, 2.0, 0.0, 1.0]])
+        padded = np.array([[np.nan, np.nan, 0.0, 2.0, 0.0, 1.0]])
+        np.testing.assert_allclose(tsb_forecast(padded), tsb_forecast(sales))
+
+    def test_vectorized_matches_per_series(self):
+        """Should give each series the result it gets on its own."""
+        rng = np.random.default_rng(0)
+        sales = rng.poisson(0.5, size=(5, 60)).astype(float)
+        batched = tsb_forecast(sales)
+        single = [tsb_forecast(row[None, :])[0] for row in sales]
+        np.testing.assert_allclose(batched, single)
+
+
+class TestBacktestTsb:
+    """Tests for backtest_tsb function."""
+
+    def test_perfect_on_constant_series(self):
+        """Should have zero error when demand never changes."""
+        result = backtest_tsb(np.full((2, 40), 1.0), holdout=10)
+        np.testing.assert_allclose(result, [0.0, 0.0])
+
+
+class TestRoutingReport:
+    """Tests for routing_report function."""
+
+    def test_records_method_per_series(self, sample_lookup_df, sample_arrays):
+        """Should list the routing decision and lookup stats per series."""
+        classified = classify_series(sample_lookup_df)
+        report = routing_report(
+            classified, sample_arrays, np.array([False, True]), holdout=2
+        )
+        assert report["method"].tolist() == ["xgboost", "tsb"]
+        assert report["avg_sales"].tolist() == [50.0, 0.5]
+        assert "xgb_holdout_mae" not in report.columns
+
+    def test_tsb_fitted_on_history_window(self, sample_lookup_df, sample_arrays):
+        """Should fit TSB only on the days just before the holdout."""
+        classified = classify_series(sample_lookup_df)
+        report = routing_report(
+            classified,
+            sample_arrays,
+            np.array([False, True]),
+            holdout=2,
+            tsb_history_days=1,
+        )
+        # Level 2.0 from the single day before the holdout [3.0, 4.0]
+        assert report["tsb_holdout_mae"].iloc[0] == pytest.approx(1.5)
+
+    def test_model_rollout_from_holdout_start(self, sample_lookup_df, sample_arrays):
+        """Should roll the model out over the holdout from the row before it."""
+        mock_model = Mock()
+        mock_model.predict.side_effect = lambda X: np.full(len(X), 3.0)
+
+        classified = classify_series(sample_lookup_df)
+        report = routing_report(
+            classified,
+            sample_arrays,
+            np.array([False, True]),
+            holdout=2,
+            model=mock_model,
+            feature_columns=["f0", "f1"],
+        )
+        # One predict per holdout day, starting from feature row 1
+        assert mock_model.predict.call_count == 2
+        np.testing.assert_array_equal(
+            mock_model.predict.call_args_list[0].args[0], [[2.0, 3.0]]
+        )
+        assert report["xgb_holdout_mae"].iloc[0] == pytest.approx(0.5)
+        # No row before the holdout
+        assert np.isnan(report["xgb_holdout_mae"].iloc[1])
@@ -2,14 +2,22 @@
 
 import json
 import numpy as np
+import pandas as pd
 from unittest.mock import Mock
 
 from model.model_utils import (
     load_feature_columns,
     load_config,
     predict,
+    autoregressive_forecast,
+    forecast_from_arrays,
+    evaluate_fast_inference,
+    forecast_batch,
+    forecast_promo_scenarios,
 )
 
+FEATURES = ["unit_sales_lag1", "unit_sales_7d_avg", "dayofweek"]
+
 
 class TestLoadFeatureColumns:
     """Tests for load_feature_columns function."""
@@ -128,3 +136,241 @@ class TestPredict:
         result = predict(mock_model, mock_scaler, X)
 
         assert isinstance(result, np.ndarray)
+
+
+class TestForecastFromArrays:
+    """Tests for forecast_from_arrays function."""
+
+    def test_returns_n_predictions(self):
+        """Should return one prediction per forecast day."""
+        mock_model = Mock()
+        mock_model.predict.return_value = np.array([3.0])
+
+        result = forecast_from_arrays(
+            mock_model, np.zeros(3), [1.0] * 10, "2024-01-01", FEATURES, 5
+        )
+        assert result == [3.0] * 5
+        assert mock_model.predict.call_count == 5
+
+    def test_clips_negative_predictions(self):
+        """Should never return negative sales."""
+        mock_model = Mock()
+        mock_model.predict.return_value = np.array([-2.0])
+
+        result = forecast_from_arrays(
+            mock_model, np.zeros(3), [1.0] * 10, "2024-01-01", FEATURES, 2
+        )
+        assert result == [0.0, 0.0]
+
+    def test_updates_lag_and_calendar_features(self):
+        """Should feed the prediction back as lag1 and advance the date."""
+        mock_model = Mock()
+        mock_model.predict.return_value = np.array([7.0])
+
+        # 2024-01-01 is a Monday, so the next day has dayofweek == 1
+        forecast_from_arrays(
+            mock_model, np.zeros(3), [0.0] * 10, "2024-01-01", FEATURES, 2
+        )
+        second_X = mock_model.predict.call_args_list[1][0][0]
+        assert second_X[0, 0] == 7.0
+        assert second_X[0, 1] == np.float32(7.0 / 7)
+        assert second_X[0, 2] == 1
+
+    def test_passes_iteration_range(self):
+        """Should forward iteration_range to model.predict when given."""
+        mock_model = Mock()
+        mock_model.predict.return_value = np.array([1.0])
+
+        forecast_from_arrays(
+            mock_model,
+            np.zeros(3),
+            [0.0] * 10,
+            "2024-01-01",
+            FEATURES,
+            2,
+            iteration_range=(0, 100),
+        )
+        for call in mock_model.predict.call_args_list:
+            assert call.kwargs == {"iteration_range": (0, 100)}
+
+    def test_does_not_modify_input(self):
+        """Should not write into the caller's feature array."""
+        mock_model = Mock()
+        mock_model.predict.return_value = np.array([5.0])
+        X = np.zeros(3, dtype=np.float32)
+
+        forecast_from_arrays(mock_model, X, [0.0] * 10, "2024-01-01", FEATURES, 3)
+        np.testing.assert_array_equal(X, np.zeros(3))
+
+
+class TestAutoregressiveForecast:
+    """Tests for autoregressive_forecast function."""
+
+    def test_matches_array_forecast(self):
+        """Should give the same result as forecast_from_arrays."""
+        history = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=40, freq="D"),
+                "unit_sales": np.arange(40, dtype=float),
+                "unit_sales_lag1": np.arange(40, dtype=float),
+                "unit_sales_7d_avg": np.ones(40),
+                "dayofweek": np.zeros(40),
+            }
+        )
+        mock_model = Mock()
+        mock_model.predict.side_effect = lambda X: np.array([X[0, 0] + 1])
+
+        result = autoregressive_forecast(mock_model, history, FEATURES, 3)
+        expected = forecast_from_arrays(
+            mock_model,
+            history[FEATURES].to_numpy()[-1],
+            history["unit_sales"].to_numpy()[-30:],
+            history["date"].max(),
+            FEATURES,
+            3,
+        )
+        assert result == expected == [40.0, 41.0, 42.0]
+
+
+class TestEvaluateFastInference:
+    """Tests for evaluate_fast_inference function."""
+
+    def make_model(self):
+        """Mock model whose truncated predictions are off by one unit."""
+        mock_model = Mock()
+        mock_model.get_booster.return_value.num_boosted_rounds.return_value = 500
+
+        def fake_predict(X, iteration_range=None):
+            offset = 0.0 if iteration_range is None else 1.0
+            return X[:, 0] + offset
+
+        mock_model.predict.side_effect = fake_predict
+        return mock_model
+
+    def make_df(self, values):
+        """Single-series sample data with feature ``f`` equal to sales."""
+        return pd.DataFrame(
+            {
+                "store_nbr": 1,
+                "item_nbr": 10,
+                "date": pd.date_range("2017-01-01", periods=len(values)),
+                "f": values,
+                "unit_sales": values,
+            }
+        )
+
+    def test_reports_accuracy_delta(self):
+        """Should compare truncated predictions to full ones and to actuals."""
+        df = self.make_df([1.0, 2.0, 3.0])
+
+        report = evaluate_fast_inference(self.make_model(), df, ["f"], 100)
+        assert report["n_trees"] == 100
+        assert report["total_trees"] == 500
+        assert report["rmse_full"] == 0.0
+        assert report["rmse_fast"] == 1.0
+        assert report["mae_vs_full"] == 1.0
+
+    def test_caps_trees_at_model_size(self):
+        """Should not request more trees than the model has."""
+        df = self.make_df([1.0])
+
+        report = evaluate_fast_inference(self.make_model(), df, ["f"], 1000)
+        assert report["n_trees"] == 500
+
+    def test_times_single_series_rollouts(self):
+        """Should time day-by-day rollouts, one predict call per day."""
+        model = self.make_model()
+        df = self.make_df([1.0, 2.0, 3.0])
+
+        report = evaluate_fast_inference(model, df, ["f"], 100, n_days=4)
+        # Two bulk predicts, then a full and a fast 4-day rollout
+        assert model.predict.call_count == 2 + 2 * 4
+        assert report["speedup"] > 0
+
+
+class TestForecastBatch:
+    """Tests for forecast_batch function."""
+
+    def test_one_predict_call_per_day(self):
+        """Should predict all rows together each day."""
+        mock_model = Mock()
+        mock_model.predict.side_effect = lambda X: X[:, 0] + 1
+
+        result = forecast_batch(
+            mock_model,
+            np.array([[0.0, 0, 0], [10.0, 0, 0]]),
+            np.zeros((2, 10)),
+            "2024-01-01",
+            FEATURES,
+            3,
+        )
+        assert mock_model.predict.call_count == 3
+        np.testing.assert_array_equal(result, [[1, 2, 3], [11, 12, 13]])
+
+    def test_rows_match_single_forecasts(self):
+        """Should give each row the forecast it gets on its own."""
+        mock_model = Mock()
+        mock_model.predict.side_effect = lambda X: X[:, 0] * 0.5 + X[:, 1]
+
+        X = np.array([[4.0, 1.0, 0.0], [8.0, 2.0, 0.0]])
+        recent = np.array([np.arange(10.0), np.arange(10.0) * 2])
+        batched = forecast_batch(mock_model, X, recent, "2024-01-01", FEATURES, 5)
+        for row in range(2):
+            single = forecast_from_arrays(
+                mock_model, X[row], recent[row], "2024-01-01", FEATURES, 5
+            )
+            np.testing.assert_allclose(batched[row], single)
+
+    def test_applies_overrides_per_day(self):
+        """Should set override features before each day's prediction."""
+        mock_model = Mock()
+        mock_model.predict.side_effect = lambda X: X[:, 2]
+
+        overrides = {"dayofweek": np.array([[5.0, 6.0], [1.0, 2.0]])}
+        result = forecast_batch(
+            mock_model,
+            np.zeros((2, 3)),
+            np.zeros((2, 10)),
+            "2024-01-01",
+            FEATURES,
+            2,
+            overrides=overrides,
+        )
+        np.testing.assert_array_equal(result, [[5, 6], [1, 2]])
+
+
+class TestForecastPromoScenarios:
+    """Tests for forecast_promo_scenarios function."""
+
+    def test_returns_column_per_scenario(self):
+        """Should roll out every calendar and name columns after scenarios."""
+        features = [
+            "unit_sales_lag1",
+            "onpromotion",
+            "promo_item_interaction",
+            "item_avg_sales",
+        ]
+        history = pd.DataFrame(
+            {
+                "date": pd.date_range("2024-01-01", periods=10, freq="D"),
+                "unit_sales": np.ones(10),
+                "unit_sales_lag1": np.ones(10),
+                "onpromotion": np.zeros(10),
+                "promo_item_interaction": np.zeros(10),
+                "item_avg_sales": np.full(10, 3.0),
+            }
+        )
+        mock_model = Mock()
+        # Sales are the promo interaction term, so promo days sell 3 units
+        mock_model.predict.side_effect = lambda X: X[:, 2]
+
+        result = forecast_promo_scenarios(
+            mock_model,
+            history,
+            features,
+            {"none": np.zeros(3), "mid": np.array([0, 1, 0])},
+        )
+        assert list(result.columns) == ["none", "mid"]
+        assert result["none"].tolist() == [0, 0, 0]
+        assert result["mid"].tolist() == [0, 3, 0]
+        assert mock_model.predict.call_count == 3
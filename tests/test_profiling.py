@@ -0,0 +1,123 @@
+"""Tests for profiling module."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from app.profiling import PipelineProfiler, profiling_enabled, report_path_for
+
+
+class TestProfilingEnabled:
+    """Tests for profiling_enabled function."""
+
+    def test_reads_environment(self, monkeypatch):
+        """Should follow the FORECAST_PROFILE environment variable."""
+        monkeypatch.setenv("FORECAST_PROFILE", "1")
+        assert profiling_enabled()
+        monkeypatch.setenv("FORECAST_PROFILE", "0")
+        assert not profiling_enabled()
+        monkeypatch.delenv("FORECAST_PROFILE")
+        assert not profiling_enabled()
+
+
+class TestPipelineProfiler:
+    """Tests for PipelineProfiler class."""
+
+    def test_records_stage_allocations(self):
+        """Should attribute a stage's allocations to it."""
+        profiler = PipelineProfiler(enabled=True)
+        with profiler.stage("allocate"):
+            data = bytearray(5_000_000)
+
+        (stage,) = profiler.stages
+        assert stage["stage"] == "allocate"
+        assert stage["traced_peak_bytes"] >= len(data)
+        assert stage["top_allocators"][0]["size_diff_bytes"] >= len(data)
+        assert stage["rss_after_bytes"] is None or stage["rss_after_bytes"] > 0
+        assert "process_peak_rss_bytes" in stage
+
+    def test_samples_peak_rss_of_freed_memory(self):
+        """Should record a spike that is freed before the stage ends."""
+        profiler = PipelineProfiler(enabled=True, sample_interval=0.005)
+        with profiler.stage("spike"):
+            spike = np.ones(50_000_000, dtype=np.uint8)
+            time.sleep(0.05)
+            del spike
+
+        (stage,) = profiler.stages
+        if stage["rss_before_bytes"] is None:
+            return  # RSS not available on this platform
+        assert stage["peak_rss_bytes"] >= stage["rss_before_bytes"] + 40_000_000
+        assert stage["peak_rss_bytes"] > stage["rss_after_bytes"]
+
+    def test_overlapping_stages_in_threads(self):
+        """Should not stop tracing under a stage running in another thread."""
+        errors = []
+        inside = threading.Barrier(2)
+
+        def run(delay_exit):
+            try:
+                profiler = PipelineProfiler(enabled=True)
+                with profiler.stage("thread"):
+                    inside.wait(timeout=5)
+                    if delay_exit:
+                        inside.wait(timeout=5)
+                if not delay_exit:
+                    inside.wait(timeout=5)
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(flag,)) for flag in (0, 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_disabled_is_noop(self, tmp_path):
+        """Should record and write nothing when disabled."""
+        profiler = PipelineProfiler(enabled=False)
+        with profiler.stage("noop"):
+            pass
+
+        assert profiler.stages == []
+        assert profiler.write_report(tmp_path / "report.json") is None
+        assert not (tmp_path / "report.json").exists()
+
+    def test_writes_json_report(self, tmp_path):
+        """Should write all stages as JSON."""
+        profiler = PipelineProfiler(enabled=True)
+        for name in ("first", "second"):
+            with profiler.stage(name):
+                pass
+
+        path = profiler.write_report(report_path_for(tmp_path / "out.csv"))
+        report = json.loads(Path(path).read_text())
+        assert path.endswith("out.csv.profile.json")
+        assert [s["stage"] for s in report["stages"]] == ["first", "second"]
+
+    def test_rewrites_report_after_each_stage(self, tmp_path):
+        """Should keep the report file current, labelled and bounded."""
+        path = tmp_path / "reports" / "session.json"
+        profiler = PipelineProfiler(
+            enabled=True, label="session", report_path=path, max_stages=2
+        )
+        for run in range(2):
+            profiler.start_run()
+            with profiler.stage(f"stage{run}"):
+                pass
+            report = json.loads(path.read_text())
+            assert report["stages"][-1]["stage"] == f"stage{run}"
+
+        with profiler.stage("extra"):
+            pass
+        report = json.loads(path.read_text())
+        assert report["label"] == "session"
+        assert [(s["run"], s["stage"]) for s in report["stages"]] == [
+            (2, "stage1"),
+            (2, "extra"),
+        ]
+        assert list(path.parent.iterdir()) == [path]
@@ -0,0 +1,50 @@
+"""Tests for shared_utils module."""
+
+import numpy as np
+import pytest
+
+from data.shared_utils import publish_arrays, attach_arrays, release_arrays
+
+
+@pytest.fixture
+def published():
+    """Publish a small set of arrays and unlink them afterwards."""
+    arrays = {
+        "features": np.arange(12, dtype=np.float32).reshape(4, 3),
+        "offsets": np.array([0, 4], dtype=np.int64),
+        "empty": np.zeros((0, 3), dtype=np.float32),
+    }
+    blocks, spec = publish_arrays(arrays)
+    yield arrays, spec
+    release_arrays(blocks, unlink=True)
+
+
+class TestSharedArrays:
+    """Tests for publish_arrays / attach_arrays round trip."""
+
+    def test_attached_views_match(self, published):
+        """Should expose the published values with shape and dtype."""
+        arrays, spec = published
+        blocks, views = attach_arrays(spec)
+        for name, array in arrays.items():
+            assert views[name].dtype == array.dtype
+            np.testing.assert_array_equal(views[name], array)
+        del views
+        release_arrays(blocks)
+
+    def test_views_are_read_only(self, published):
+        """Should prevent workers from writing into shared data."""
+        _, spec = published
+        blocks, views = attach_arrays(spec)
+        with pytest.raises(ValueError):
+            views["features"][0, 0] = 1.0
+        del views
+        release_arrays(blocks)
+
+    def test_spec_is_plain_data(self, published):
+        """Should describe blocks with picklable tuples."""
+        _, spec = published
+        name, shape, dtype = spec["features"]
+        assert isinstance(name, str)
+        assert shape == (4, 3)
+        assert np.dtype(dtype) == np.float32
@@ -0,0 +1,165 @@
+"""Tests for validation_utils module."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.validation_utils import iter_data_chunks, validate_data, validate_inputs
+
+FEATURES = ["unit_sales_lag1", "dayofweek"]
+
+
+@pytest.fixture
+def sample_df():
+    """Two consecutive-day series of four rows each, grouped by series."""
+    dates = pd.date_range("2017-08-01", periods=4)
+    return pd.DataFrame(
+        {
+            "date": list(dates) * 2,
+            "store_nbr": [1] * 8,
+            "item_nbr": [100] * 4 + [101] * 4,
+            "unit_sales": np.arange(8, dtype=np.float64),
+            "unit_sales_lag1": np.arange(8, dtype=np.float64),
+            "dayofweek": [d.dayofweek for d in dates] * 2,
+        }
+    )
+
+
+@pytest.fixture
+def sample_lookup_df():
+    """Lookup with both series of sample_df."""
+    return pd.DataFrame({"store_nbr": [1, 1], "item_nbr": [100, 101]})
+
+
+def write_inputs(tmp_path, df, lookup_df):
+    """Write data, lookup and feature files as the app reads them."""
+    data_path = tmp_path / "data.csv"
+    lookup_path = tmp_path / "lookup.csv"
+    features_path = tmp_path / "features.json"
+    df.to_csv(data_path, index=False)
+    lookup_df.to_csv(lookup_path, index=False)
+    features_path.write_text(json.dumps(FEATURES))
+    return data_path, lookup_path, features_path
+
+
+class TestIterDataChunks:
+    """Tests for iter_data_chunks function."""
+
+    @pytest.mark.parametrize("suffix", ["csv", "parquet", "pkl"])
+    def test_reads_in_chunks(self, sample_df, tmp_path, suffix):
+        """Should yield every row in chunks of at most chunk_rows."""
+        path = tmp_path / f"data.{suffix}"
+        if suffix == "csv":
+            sample_df.to_csv(path, index=False)
+        elif suffix == "parquet":
+            sample_df.to_parquet(path)
+        else:
+            sample_df.to_pickle(path)
+
+        chunks = list(iter_data_chunks(path, chunk_rows=3))
+        assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+
+    def test_rejects_unknown_format(self, tmp_path):
+        """Should raise for unsupported file types."""
+        with pytest.raises(ValueError):
+            list(iter_data_chunks(tmp_path / "data.xlsx"))
+
+
+class TestValidateData:
+    """Tests for validate_data function."""
+
+    def test_clean_data_is_valid(self, sample_df, sample_lookup_df, tmp_path):
+        """Should pass data without issues."""
+        path = tmp_path / "data.pkl"
+        sample_df.to_pickle(path)
+
+        report = validate_data(path, FEATURES, sample_lookup_df, chunk_rows=3)
+        assert report["valid"]
+        assert report["n_rows"] == 8
+        assert report["n_series"] == 2
+        assert report["errors"] == report["warnings"] == []
+
+    def test_missing_feature_column(self, sample_df, tmp_path):
+        """Should report feature columns absent from the data."""
+        path = tmp_path / "data.pkl"
+        sample_df.drop(columns="dayofweek").to_pickle(path)
+
+        report = validate_data(path, FEATURES)
+        assert report["missing_columns"] == ["dayofweek"]
+        assert not report["valid"]
+
+    def test_counts_nan_and_inf(self, sample_df, tmp_path):
+        """Should count missing and infinite values per column."""
+        sample_df.loc[[1, 5], "unit_sales_lag1"] = np.nan
+        sample_df.loc[2, "unit_sales"] = np.inf
+        path = tmp_path / "data.pkl"
+        sample_df.to_pickle(path)
+
+        report = validate_data(path, FEATURES, chunk_rows=3)
+        assert report["nan_counts"] == {"unit_sales_lag1": 2}
+        assert report["inf_counts"] == {"unit_sales": 1}
+        assert not report["valid"]
+
+    def test_date_order_across_chunks(self, sample_df, tmp_path):
+        """Should compare the first row of a chunk with the series' last date."""
+        # Rows 2 and 3 fall into different chunks of 3
+        sample_df.loc[3, "date"] = pd.Timestamp("2017-07-30")
+        path = tmp_path / "data.pkl"
+        sample_df.to_pickle(path)
+
+        report = validate_data(path, FEATURES, chunk_rows=3)
+        assert report["out_of_order"] == 1
+        assert not report["valid"]
+
+    def test_duplicates_and_gaps(self, sample_df, tmp_path):
+        """Should flag repeated dates as errors and gaps as warnings."""
+        sample_df.loc[1, "date"] = sample_df.loc[0, "date"]
+        sample_df.loc[7, "date"] += pd.Timedelta(days=2)
+        path = tmp_path / "data.pkl"
+        sample_df.to_pickle(path)
+
+        report = validate_data(path, FEATURES, chunk_rows=3)
+        assert report["duplicate_dates"] == 1
+        assert report["date_gaps"] == 2
+        assert len(report["warnings"]) == 1
+
+    def test_lookup_consistency(self, sample_df, tmp_path):
+        """Should count lookup pairs without data and series not in the lookup."""
+        path = tmp_path / "data.pkl"
+        sample_df.to_pickle(path)
+        lookup_df = pd.DataFrame({"store_nbr": [1, 2], "item_nbr": [100, 100]})
+
+        report = validate_data(path, FEATURES, lookup_df)
+        assert report["lookup_without_data"] == 1
+        assert report["data_without_lookup"] == 1
+        assert not report["valid"]
+
+
+class TestValidateInputs:
+    """Tests for validate_inputs function."""
+
+    def test_reuses_cached_verdict(self, sample_df, sample_lookup_df, tmp_path):
+        """Should skip the scan while the input files are unchanged."""
+        paths = write_inputs(tmp_path, sample_df, sample_lookup_df)
+        cache_path = tmp_path / "cache.json"
+
+        first = validate_inputs(*paths, cache_path=cache_path)
+        second = validate_inputs(*paths, cache_path=cache_path)
+        assert first["valid"] and not first["cached"]
+        assert second["cached"]
+        assert second["fingerprint"] == first["fingerprint"]
+
+    def test_rescans_changed_inputs(self, sample_df, sample_lookup_df, tmp_path):
+        """Should validate again when a file's contents change."""
+        paths = write_inputs(tmp_path, sample_df, sample_lookup_df)
+        cache_path = tmp_path / "cache.json"
+        validate_inputs(*paths, cache_path=cache_path)
+
+        sample_df.loc[0, "unit_sales_lag1"] = np.nan
+        sample_df.to_csv(paths[0], index=False)
+
+        report = validate_inputs(*paths, cache_path=cache_path)
+        assert not report["cached"]
+        assert report["nan_counts"] == {"unit_sales_lag1": 1}
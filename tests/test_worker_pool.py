@@ -0,0 +1,144 @@
+"""Tests for worker_pool module."""
+
+import gc
+import threading
+import time
+from unittest.mock import Mock
+
+import numpy as np
+
+from app.worker_pool import ForecastPool, SharedModel
+
+
+class TestSharedModel:
+    """Tests for SharedModel class."""
+
+    def test_serializes_predict_calls(self):
+        """Should never run two predict calls at the same time."""
+        active = []
+        overlaps = []
+
+        def slow_predict(X):
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+            return np.zeros(len(X))
+
+        model = SharedModel(Mock(predict=slow_predict))
+        threads = [
+            threading.Thread(target=model.predict, args=(np.zeros((1, 2)),))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert max(overlaps) == 1
+
+    def test_passes_through_attributes(self):
+        """Should expose the wrapped model's other attributes."""
+        inner = Mock()
+        inner.get_booster.return_value = "booster"
+        assert SharedModel(inner).get_booster() == "booster"
+
+    def test_forwards_predict_kwargs(self):
+        """Should forward keyword arguments such as iteration_range."""
+        inner = Mock()
+        SharedModel(inner).predict("X", iteration_range=(0, 10))
+        inner.predict.assert_called_once_with("X", iteration_range=(0, 10))
+
+
+class TestForecastPool:
+    """Tests for ForecastPool class."""
+
+    def test_runs_job(self):
+        """Should return the job's result."""
+        pool = ForecastPool(max_workers=1)
+        future = pool.submit("a", lambda x: x * 2, 21)
+        assert future.result(timeout=5) == 42
+        pool.shutdown()
+
+    def test_new_request_cancels_queued_one(self):
+        """Should cancel a session's queued request when it submits again."""
+        pool = ForecastPool(max_workers=1)
+        release = threading.Event()
+        blocker = pool.submit("other", release.wait)
+
+        stale = pool.submit("a", lambda: "stale")
+        fresh = pool.submit("a", lambda: "fresh")
+        release.set()
+
+        assert stale.cancelled()
+        assert fresh.result(timeout=5) == "fresh"
+        assert blocker.result(timeout=5)
+        pool.shutdown()
+
+    def test_running_request_is_no_longer_current(self):
+        """Should mark a running request stale once superseded."""
+        pool = ForecastPool(max_workers=2)
+        started = threading.Event()
+        release = threading.Event()
+
+        def job():
+            started.set()
+            release.wait()
+            return "old"
+
+        old = pool.submit("a", job)
+        started.wait(timeout=5)
+        new = pool.submit("a", lambda: "new")
+        release.set()
+
+        assert old.result(timeout=5) == "old"
+        assert not pool.is_current("a", old)
+        assert pool.is_current("a", new)
+        pool.shutdown()
+
+    def test_sessions_do_not_cancel_each_other(self):
+        """Should keep requests of different sessions independent."""
+        pool = ForecastPool(max_workers=1)
+        release = threading.Event()
+        first = pool.submit("a", release.wait)
+        second = pool.submit("b", lambda: "b")
+        release.set()
+
+        assert first.result(timeout=5)
+        assert second.result(timeout=5) == "b"
+        pool.shutdown()
+        assert pool.pending_count() == 0
+
+    def test_cancel_drops_session_request(self):
+        """Should cancel a queued request and make a running one stale."""
+        pool = ForecastPool(max_workers=1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def job():
+            started.set()
+            release.wait()
+            return "running"
+
+        running = pool.submit("a", job)
+        started.wait(timeout=5)
+        queued = pool.submit("b", lambda: "queued")
+        pool.cancel("a")
+        pool.cancel("b")
+        release.set()
+
+        assert queued.cancelled()
+        assert running.result(timeout=5) == "running"
+        assert not pool.is_current("a", running)
+        pool.shutdown()
+
+    def test_finished_sessions_are_not_retained(self):
+        """Should not keep results once nobody holds the future."""
+        pool = ForecastPool(max_workers=1)
+        future = pool.submit("a", lambda: "result")
+        future.result(timeout=5)
+        assert pool.is_current("a", future)
+
+        del future
+        gc.collect()
+        assert len(pool._latest) == 0
+        pool.shutdown()